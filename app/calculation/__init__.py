@@ -1,15 +1,31 @@
 from abc import ABC, abstractmethod
-from app.operation import Operation
+from typing import Dict, Iterable, List, Tuple
+from app.operation import Failure, Operand, Operation, Result, contains_zero
+
+# Returned by DivideCalculation.try_execute where execute raises ZeroDivisionError.
+CANNOT_DIVIDE_BY_ZERO = Failure("Cannot divide by zero.")
 
 class Calculation(ABC):
-    def __init__(self, a: float, b:float) -> None:
-        self.a: float = a
-        self.b: float = b
+    def __init__(self, a: Operand, b: Operand) -> None:
+        self.a: Operand = a
+        self.b: Operand = b
 
     @abstractmethod
-    def execute(self) -> float:
+    def execute(self) -> Operand:
         pass # pragma: no cover
 
+    """
+    Non-raising version of execute.
+    @return: The result, or a Failure describing why the calculation failed.
+    Subclasses whose errors can be detected up front should override this so
+    that no exception is raised at all.
+    """
+    def try_execute(self) -> Result:
+        try:
+            return self.execute()
+        except Exception as e:
+            return Failure(str(e))
+
     def __str__(self) -> str:
         result = self.execute()
         operation_name = self.__class__.__name__.replace('Calculation', '')
@@ -20,6 +36,8 @@ class Calculation(ABC):
     
 class CalculationFactory:
     _calculations = {}
+    # Bumped on every registration so caches built from the registry can tell it changed.
+    _version = 0
 
     """
     Register a new calculation type.
@@ -34,20 +52,21 @@ class CalculationFactory:
             if calculation_type_lower in cls._calculations:
                 raise ValueError(f"Calculation type '{calculation_type}' is already registered.")
             cls._calculations[calculation_type_lower] = subclass
+            cls._version += 1
             return subclass
         return decorator
         
     """
     Create a calculation instance based on the type and operands.
     @param calculation_type: The type of calculation to create (e.g., 'add', 'subtract').
-    @param a: The first operand.
-    @param b: The second operand.
+    @param a: The first operand, a number or a vector or 2-D array of numbers.
+    @param b: The second operand, a number or a vector or 2-D array of numbers.
     @return: An instance of the corresponding Calculation subclass.
     @raises ValueError: If the calculation type is not supported.
     @raises ZeroDivisionError: If division by zero is attempted.
     """
     @classmethod
-    def create_calculation(cls, calculation_type: str, a: float, b: float) -> Calculation:
+    def create_calculation(cls, calculation_type: str, a: Operand, b: Operand) -> Calculation:
         calculation_type_lower = calculation_type.lower()
         calculation_class = cls._calculations.get(calculation_type_lower)
 
@@ -56,13 +75,37 @@ class CalculationFactory:
             raise ValueError(f"Unsupported calculation type: '{calculation_type}'. Available types: {available_types}")
         
         return calculation_class(a,b)
+
+    """
+    Evaluate many calculations without raising on bad rows.
+    @param rows: Iterable of (calculation_type, a, b) tuples.
+    @return: A list with the result or a Failure for every row, in order.
+    """
+    @classmethod
+    def evaluate_batch(cls, rows: Iterable[Tuple[str, Operand, Operand]]) -> List[Result]:
+        calculations = cls._calculations
+        unsupported: Dict[str, Failure] = {}
+        results: List[Result] = []
+        append = results.append
+        for calculation_type, a, b in rows:
+            calculation_class = calculations.get(calculation_type.lower())
+            if calculation_class is None:
+                failure = unsupported.get(calculation_type)
+                if failure is None:
+                    available_types = ', '.join(calculations.keys())
+                    failure = Failure(f"Unsupported calculation type: '{calculation_type}'. Available types: {available_types}")
+                    unsupported[calculation_type] = failure
+                append(failure)
+            else:
+                append(calculation_class(a, b).try_execute())
+        return results
     
 @CalculationFactory.register_calculation('add')
 class AddCalculation(Calculation):
     """
     Addition calculation.
     """
-    def execute(self) -> float:
+    def execute(self) -> Operand:
         return Operation.addition(self.a, self.b)
     
 @CalculationFactory.register_calculation('subtract')
@@ -70,7 +113,7 @@ class SubtractCalculation(Calculation):
     """
     Subtraction calculation.
     """
-    def execute(self) -> float:
+    def execute(self) -> Operand:
         return Operation.subtraction(self.a, self.b)
     
 @CalculationFactory.register_calculation('multiply')
@@ -78,15 +121,23 @@ class MultiplyCalculation(Calculation):
     """
     Multiplication calculation.
     """
-    def execute(self) -> float:
+    def execute(self) -> Operand:
         return Operation.multiplication(self.a,self.b)
 
 @CalculationFactory.register_calculation('divide')
 class DivideCalculation(Calculation):
     """
-    Division calculation.
+    Division calculation. A zero divisor, or a zero anywhere in a vector
+    divisor, raises ZeroDivisionError.
     """
-    def execute(self) -> float:
-        if self.b == 0:
-            raise ZeroDivisionError("Cannot divide by zero.")
-        return Operation.division(self.a, self.b)
\ No newline at end of file
+    def execute(self) -> Operand:
+        if contains_zero(self.b):
+            raise ZeroDivisionError(CANNOT_DIVIDE_BY_ZERO.message)
+        return Operation.division(self.a, self.b)
+
+    # A zero divisor is checked up front so the common failure raises nothing;
+    # any other error is caught by the base class.
+    def try_execute(self) -> Result:
+        if contains_zero(self.b):
+            return CANNOT_DIVIDE_BY_ZERO
+        return super().try_execute()
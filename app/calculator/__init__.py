@@ -1,7 +1,17 @@
+import re
 import sys
-import readline
-from typing import List
+from typing import TYPE_CHECKING, Iterable, List, Optional
 from app.calculation import Calculation, CalculationFactory
+from app.operation import Operand
+from app.history import History
+from app.profiling import Profiler
+from app.stats import StreamingStatistics
+
+if TYPE_CHECKING: # pragma: no cover
+    from app.console import HistoryFile
+
+# The special commands of the REPL, as listed in the help and offered by tab completion.
+COMMANDS = ("help", "history", "stats", "undo", "redo", "checkpoint", "rollback", "profile", "exit")
 
 # Display help message for the calculator REPL
 # This function provides instructions on how to use the calculator,
@@ -13,6 +23,8 @@ Calculator REPL Help
 Usage:
     <operation> <number1> <number2>
     - Perform a calculation with the specified operation and two numbers.
+    - Either number can be a vector [1,2,3] or a 2-D array [[1,2],[3,4]];
+      scalars and vectors are broadcast against each other.
     - Supported operations:
         add       : Adds two numbers.
         subtract  : Subtracts the second number from the first.
@@ -22,6 +34,15 @@ Usage:
 Special Commands:
     help      : Display this help message.
     history   : Show the history of calculations.
+    stats     : Show running statistics of all results (mean, variance, quantiles).
+    undo      : Remove the last calculation from the history.
+    redo      : Restore the last undone calculation.
+    checkpoint [name] : Save the current history under a name.
+    rollback [name]   : Restore the history saved by a checkpoint.
+    profile on [mode] : Start profiling (modes: spans, cprofile, sampling).
+    profile off       : Stop profiling.
+    profile export <file> : Save the profile (.json Chrome trace, .prof pstats,
+                            otherwise collapsed stacks).
     exit      : Exit the calculator.
 
 Examples:
@@ -29,15 +50,53 @@ Examples:
     subtract 15.5 3.2
     multiply 7 8
     divide 20 4
+    add [1,2,3] 5
+    multiply [[1,2],[3,4]] [10,20]
     """
     print(help_message)
 
+_TOKEN_PATTERN = re.compile(r"\[(?:[^\[\]]|\[[^\[\]]*\])*\]|\S+")
+
+"""
+@param user_input: A line of input
+@return: The whitespace separated tokens, keeping vector literals such as [1, 2] whole
+"""
+def tokenize(user_input: str) -> List[str]:
+    return _TOKEN_PATTERN.findall(user_input)
+
+"""
+@param token: A number, or a vector or 2-D array literal such as [1,2,3]
+@return: The operand with every number converted to float
+@raises ValueError: If the token is not a number or a rectangular array of numbers
 """
-@param history: List of Calculation objects representing the history of calculations
+def parse_operand(token: str) -> Operand:
+    if not token.startswith("["):
+        return float(token)
+    import ast
+    try:
+        value = ast.literal_eval(token)
+    except SyntaxError:
+        raise ValueError(f"Invalid vector literal: {token}") from None
+    if not isinstance(value, list) or not value:
+        raise ValueError(f"Invalid vector literal: {token}")
+    if all(isinstance(row, list) for row in value):
+        width = len(value[0])
+        if width == 0 or any(len(row) != width for row in value):
+            raise ValueError(f"Arrays must be rectangular: {token}")
+        return [[_parse_number(item, token) for item in row] for row in value]
+    return [_parse_number(item, token) for item in value]
+
+def _parse_number(item, token: str) -> float:
+    if isinstance(item, bool) or not isinstance(item, (int, float)):
+        raise ValueError(f"Invalid vector literal: {token}")
+    return float(item)
+
+"""
+@param history: Calculation objects representing the history of calculations
 This function prints the history of calculations performed in the REPL.
 If no calculations have been performed, it informs the user.
 """
-def display_history(history: List[Calculation]) -> None:
+def display_history(history: Iterable[Calculation]) -> None:
     if not history:
         print("No calculations performed yet.")
     else:
@@ -45,12 +104,67 @@ def display_history(history: List[Calculation]) -> None:
         for idx, calculation in enumerate(history, start=1):
             print(f"{idx}. {calculation}")
 
+"""
+@param profiler: The profiler to record the session with
+@param args: Arguments of the profile command
+This function handles 'profile on [mode]', 'profile off' and 'profile export <file>'.
+Subcommands and modes are case-insensitive; the export path is kept as typed.
+"""
+def handle_profile_command(profiler: Profiler, args: List[str]) -> None:
+    action = args[0].lower() if args else ""
+    try:
+        if action == "on" and len(args) <= 2:
+            profiler.start(*(mode.lower() for mode in args[1:]))
+            print(f"Profiling on ({profiler.mode}).\n")
+        elif action == "off" and len(args) == 1:
+            profiler.stop()
+            print("Profiling off.\n")
+        elif action == "export" and len(args) == 2:
+            profiler.export(args[1])
+            print(f"Profile exported to {args[1]}.\n")
+        else:
+            print("Usage: profile on [mode] | profile off | profile export <file>\n")
+    except (ValueError, OSError) as e:
+        print(f"{e}\n")
+
+"""
+@param statistics: Running statistics of the calculation results
+This function prints the statistics of every result computed in the REPL.
+If no calculations have been performed, it informs the user.
+"""
+def display_statistics(statistics: StreamingStatistics) -> None:
+    if not statistics:
+        print("No calculations performed yet.")
+    else:
+        print("Result Statistics:")
+        print(statistics.summary())
+
+# readline only changes how input() behaves on a terminal and is slow to load,
+# so it is set up when an interactive session starts instead of on import.
+# Returns the input history file to save at the end of the session, if any.
+def enable_line_editing() -> Optional["HistoryFile"]:
+    if not sys.stdin.isatty():
+        return None
+    from app.console import setup_readline
+    return setup_readline()
+
+# Stop profiling and save the input history in the background before exiting.
+def end_session(profiler: Profiler, input_history: Optional["HistoryFile"]) -> None:
+    profiler.stop()
+    if input_history is not None:
+        input_history.save_async()
+
 # Main function for the Professional Calculator REPL
 # This function initializes the REPL, handles user input, performs calculations,
 # and manages the history of calculations.
 # It supports basic arithmetic operations and provides a user-friendly interface.
-def calculator() -> None:
-    history: List[Calculation] = []
+# The stages of every line are timed by the profiler while profiling is on.
+def calculator(profiler: Optional[Profiler] = None) -> None:
+    history: History = History()
+    statistics: StreamingStatistics = StreamingStatistics()
+    if profiler is None:
+        profiler = Profiler()
+    input_history = enable_line_editing()
 
     print("Welcome to the Professional Calculator REPL!")
     print("Type 'help' for instructions or 'exit' to quit.\n")
@@ -66,30 +180,63 @@ def calculator() -> None:
                 display_help()
                 continue
             elif command == "history":
-                display_history(history)
+                with profiler.span("history"):
+                    display_history(history)
+                continue
+            elif command == "stats":
+                display_statistics(statistics)
+                continue
+            elif command == "undo":
+                undone = history.undo()
+                print(f"Undid: {undone}\n" if undone is not None else "Nothing to undo.\n")
+                continue
+            elif command == "redo":
+                redone = history.redo()
+                print(f"Redid: {redone}\n" if redone is not None else "Nothing to redo.\n")
+                continue
+            elif command.split()[0] in ("checkpoint", "rollback"):
+                keyword, *names = user_input.split()
+                if len(names) > 1:
+                    print(f"Usage: {keyword.lower()} [name]\n")
+                    continue
+                name = names[0] if names else None
+                if keyword.lower() == "checkpoint":
+                    print(f"Saved checkpoint '{history.checkpoint(name)}'.\n")
+                else:
+                    try:
+                        print(f"Rolled back to checkpoint '{history.rollback(name)}'.\n")
+                    except ValueError as ve:
+                        print(f"{ve}\n")
+                continue
+            elif command.split()[0] == "profile":
+                handle_profile_command(profiler, user_input.split()[1:])
                 continue
             elif command == "exit":
+                end_session(profiler, input_history)
                 print("Exiting calculator. Goodbye!")
                 sys.exit(0)
 
             try:
-                operation, num1_str, num2_str = user_input.split()
-                num1: float = float(num1_str)
-                num2: float = float(num2_str)
+                with profiler.span("parse"):
+                    operation, num1_str, num2_str = tokenize(user_input)
+                    num1: Operand = parse_operand(num1_str)
+                    num2: Operand = parse_operand(num2_str)
             except ValueError:
                 print("Invalid input. Please follow the format: <operation> <num1> <num2>")
                 print("Type 'help' for more information.\n")
                 continue
 
             try:
-                calculation = CalculationFactory.create_calculation(operation, num1, num2)
+                with profiler.span("dispatch"):
+                    calculation = CalculationFactory.create_calculation(operation, num1, num2)
             except ValueError as ve:
                 print(ve)
                 print("Type 'help' to see the list of supported operations.\n")
                 continue
 
             try:
-                result = calculation.execute()
+                with profiler.span("execute"):
+                    result = calculation.execute()
             except ZeroDivisionError:
                 print("Cannot divide by zero.")
                 print("Please enter a non-zero divisor.\n")
@@ -99,14 +246,18 @@ def calculator() -> None:
                 print("Please try again.\n")
                 continue
 
-            result_str: str = f"{calculation}"
+            with profiler.span("format"):
+                result_str: str = f"{calculation}"
             print(f"Result: {result_str}\n")
             history.append(calculation)
+            statistics.update(result)
 
         except KeyboardInterrupt:
+            end_session(profiler, input_history)
             print("\nKeyboard interrupt detected. Exiting calculator. Goodbye!")
             sys.exit(0)
         except EOFError:
+            end_session(profiler, input_history)
             print("\nEOF detected. Exiting calculator. Goodbye!")
             sys.exit(0)
 
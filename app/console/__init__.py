@@ -0,0 +1,132 @@
+import os
+import readline
+import threading
+from bisect import bisect_left
+from typing import Callable, Iterable, List, Optional, Tuple
+from app.calculation import CalculationFactory
+from app.calculator import COMMANDS
+
+DEFAULT_HISTORY_FILE = os.path.join(os.path.expanduser("~"), ".calculator_history")
+DEFAULT_HISTORY_LENGTH = 1000
+
+class PrefixIndex:
+    """
+    Sorted word list that answers prefix queries with two binary searches,
+    so a lookup costs O(log n + matches) however many words there are.
+    """
+    def __init__(self, words: Iterable[str]) -> None:
+        self._words: List[str] = sorted(set(words))
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def complete(self, prefix: str) -> List[str]:
+        start = bisect_left(self._words, prefix)
+        end = bisect_left(self._words, prefix + "\U0010ffff", start)
+        return self._words[start:end]
+
+class Completer:
+    """
+    Readline completer for operation names and REPL commands.
+
+    The operation names come from the live CalculationFactory registry. The
+    prefix index is rebuilt only when the registry has changed since the
+    last completion, not on every key press.
+    """
+    def __init__(self, line_buffer: Callable[[], str] = readline.get_line_buffer,
+                 word_start: Callable[[], int] = readline.get_begidx,
+                 commands: Iterable[str] = COMMANDS) -> None:
+        self._line_buffer = line_buffer
+        self._word_start = word_start
+        self._commands: Tuple[str, ...] = tuple(commands)
+        self._registry_key: Optional[Tuple[int, int]] = None
+        self._index: PrefixIndex = PrefixIndex(self._commands)
+        self._matches: List[str] = []
+
+    @property
+    def index(self) -> PrefixIndex:
+        registry_key = (CalculationFactory._version, len(CalculationFactory._calculations))
+        if registry_key != self._registry_key:
+            self._index = PrefixIndex([*self._commands, *CalculationFactory._calculations])
+            self._registry_key = registry_key
+        return self._index
+
+    """
+    Completion function in the form readline.set_completer expects.
+    @param text: The word being completed.
+    @param state: The index of the match readline is asking for.
+    @return: The match for this state, or None when there are no more.
+    Only the first word of a line is completed.
+    """
+    def complete(self, text: str, state: int) -> Optional[str]:
+        if state == 0:
+            before_word = self._line_buffer()[:self._word_start()].strip()
+            self._matches = [] if before_word else [f"{word} " for word in self.index.complete(text.lower())]
+        return self._matches[state] if state < len(self._matches) else None
+
+class HistoryFile:
+    """
+    Persistent readline input history with a size cap.
+
+    Saving appends only the lines entered in this session and then trims the
+    file to its last `length` entries, so the file never grows without bound,
+    loading it stays fast and saving does not rewrite the whole file.
+    """
+    def __init__(self, path: str = DEFAULT_HISTORY_FILE, length: int = DEFAULT_HISTORY_LENGTH) -> None:
+        if length < 1:
+            raise ValueError("History length must be at least 1.")
+        self.path: str = path
+        self.length: int = length
+        self._loaded: int = 0
+
+    def load(self) -> int:
+        readline.set_history_length(self.length)
+        try:
+            readline.read_history_file(self.path)
+        except OSError:
+            pass
+        self._loaded = readline.get_current_history_length()
+        return self._loaded
+
+    def save(self) -> None:
+        new_entries = min(readline.get_current_history_length() - self._loaded, self.length)
+        if new_entries <= 0:
+            return
+        if not os.path.exists(self.path):
+            open(self.path, "a").close()
+        readline.append_history_file(new_entries, self.path)
+        self._loaded = readline.get_current_history_length()
+
+    """
+    Save the history on a background thread.
+    @return: The thread doing the save. It is not a daemon thread, so the
+    interpreter waits for it to finish before the process exits.
+    """
+    def save_async(self) -> threading.Thread:
+        thread = threading.Thread(target=self._save_quietly, name="history-save")
+        thread.start()
+        return thread
+
+    def _save_quietly(self) -> None:
+        try:
+            self.save()
+        except OSError:
+            pass
+
+"""
+Configure readline for an interactive session: load the persistent input
+history and enable tab completion.
+@param history_file: Path of the history file. Defaults to $CALCULATOR_HISTFILE
+or ~/.calculator_history.
+@param history_length: Maximum number of history entries to keep.
+@return: The HistoryFile to save when the session ends.
+"""
+def setup_readline(history_file: Optional[str] = None,
+                   history_length: int = DEFAULT_HISTORY_LENGTH) -> HistoryFile:
+    path = history_file or os.environ.get("CALCULATOR_HISTFILE", DEFAULT_HISTORY_FILE)
+    history = HistoryFile(path, history_length)
+    history.load()
+    readline.set_completer(Completer().complete)
+    readline.set_completer_delims(" \t\n")
+    readline.parse_and_bind("tab: complete")
+    return history
@@ -0,0 +1,110 @@
+from typing import Dict, Iterator, List, Optional
+from app.calculation import Calculation
+
+class _Node:
+    """
+    Immutable cell of the persistent history list. Each node points at the
+    entry that came before it, so every older version of the history is
+    still reachable and shares all of its cells with the newer ones.
+    """
+    __slots__ = ('calculation', 'parent', 'size')
+
+    def __init__(self, calculation: Calculation, parent: Optional['_Node']) -> None:
+        self.calculation: Calculation = calculation
+        self.parent: Optional[_Node] = parent
+        self.size: int = 1 if parent is None else parent.size + 1
+
+class History:
+    """
+    Calculation history with undo, redo, checkpoints and rollback.
+
+    The history is stored as a persistent linked list, newest entry first.
+    Appending creates a single node and a checkpoint only keeps a reference
+    to the current head, so both are O(1) no matter how many entries the
+    session holds and no entry is ever copied.
+    """
+    def __init__(self) -> None:
+        self._head: Optional[_Node] = None
+        self._redo: List[Calculation] = []
+        self._checkpoints: Dict[str, Optional[_Node]] = {}
+
+    def __len__(self) -> int:
+        return 0 if self._head is None else self._head.size
+
+    def __iter__(self) -> Iterator[Calculation]:
+        entries: List[Calculation] = []
+        node = self._head
+        while node is not None:
+            entries.append(node.calculation)
+            node = node.parent
+        return reversed(entries)
+
+    """
+    Add a calculation to the end of the history.
+    @param calculation: The calculation to record.
+    Appending discards anything that could have been redone.
+    """
+    def append(self, calculation: Calculation) -> None:
+        self._head = _Node(calculation, self._head)
+        self._redo.clear()
+
+    """
+    Remove the most recent calculation from the history.
+    @return: The calculation that was removed, or None if the history is empty.
+    """
+    def undo(self) -> Optional[Calculation]:
+        if self._head is None:
+            return None
+        calculation = self._head.calculation
+        self._head = self._head.parent
+        self._redo.append(calculation)
+        return calculation
+
+    """
+    Restore the calculation most recently removed by undo.
+    @return: The restored calculation, or None if there is nothing to redo.
+    """
+    def redo(self) -> Optional[Calculation]:
+        if not self._redo:
+            return None
+        calculation = self._redo.pop()
+        self._head = _Node(calculation, self._head)
+        return calculation
+
+    """
+    Save the current state of the history under a name.
+    @param name: The checkpoint name. Defaults to the next free number.
+    @return: The name the checkpoint was saved under.
+    Saving under an existing name replaces that checkpoint and makes it the
+    most recent one.
+    """
+    def checkpoint(self, name: Optional[str] = None) -> str:
+        if name is None:
+            name = str(len(self._checkpoints) + 1)
+            while name in self._checkpoints:
+                name = str(int(name) + 1)
+        # Re-insert so the dict order stays the order the checkpoints were saved in.
+        self._checkpoints.pop(name, None)
+        self._checkpoints[name] = self._head
+        return name
+
+    """
+    Return the history to the state saved by a checkpoint.
+    @param name: The checkpoint to restore. Defaults to the most recent one.
+    @return: The name of the checkpoint that was restored.
+    @raises ValueError: If there is no such checkpoint.
+    """
+    def rollback(self, name: Optional[str] = None) -> str:
+        if name is None:
+            if not self._checkpoints:
+                raise ValueError("No checkpoints have been saved.")
+            name = next(reversed(self._checkpoints))
+        if name not in self._checkpoints:
+            available = ', '.join(self._checkpoints.keys())
+            raise ValueError(f"Unknown checkpoint: '{name}'. Available checkpoints: {available}")
+        self._head = self._checkpoints[name]
+        self._redo.clear()
+        return name
+
+    def checkpoints(self) -> List[str]:
+        return list(self._checkpoints.keys())
@@ -1,56 +1,193 @@
+import operator
+from array import array
+from itertools import repeat
+from typing import Callable, Sequence, Tuple, Union
+
+Operand = Union[float, Sequence[float], Sequence[Sequence[float]]]
+
+_SEQUENCE_TYPES = (list, tuple, array, memoryview)
+
+class Failure:
+    """
+    Error value returned by the non-raising API in place of an exception.
+    Check for it with isinstance(result, Failure).
+    """
+    __slots__ = ('message',)
+
+    def __init__(self, message: str) -> None:
+        self.message: str = message
+
+    def __str__(self) -> str:
+        return self.message
+
+    def __repr__(self) -> str:
+        return f"Failure({self.message!r})"
+
+DIVISION_BY_ZERO = Failure("Division by zero is not allowed.")
+
+Result = Union[Operand, Failure]
+
+class _ShapeMismatch(Exception):
+    pass
+
+def _ndim(value: Operand) -> int:
+    dims = 0
+    while isinstance(value, _SEQUENCE_TYPES):
+        dims += 1
+        if not value:
+            break
+        value = value[0]
+    return dims
+
+def _shape(value: Operand) -> Tuple[int, ...]:
+    shape = []
+    while isinstance(value, _SEQUENCE_TYPES):
+        shape.append(len(value))
+        if not value:
+            break
+        value = value[0]
+    return tuple(shape)
+
+def _broadcast(op: Callable, a: Operand, b: Operand, a_dims: int, b_dims: int) -> Operand:
+    if a_dims > b_dims:
+        if a_dims == 1:
+            return list(map(op, a, repeat(b, len(a))))
+        return [_broadcast(op, row, b, a_dims - 1, b_dims) for row in a]
+    if b_dims > a_dims:
+        if b_dims == 1:
+            return list(map(op, repeat(a, len(b)), b))
+        return [_broadcast(op, a, row, a_dims, b_dims - 1) for row in b]
+    if len(a) != len(b):
+        if len(a) == 1:
+            a = [a[0]] * len(b)
+        elif len(b) == 1:
+            b = [b[0]] * len(a)
+        else:
+            raise _ShapeMismatch()
+    if a_dims == 1:
+        return list(map(op, a, b))
+    return [_broadcast(op, row_a, row_b, a_dims - 1, b_dims - 1) for row_a, row_b in zip(a, b)]
+
+"""
+Apply a binary operator element by element with NumPy-style broadcasting.
+@param op: The operator to apply (e.g., operator.add).
+@param a: Scalar, vector or 2-D array given as nested lists or tuples.
+@param b: Scalar, vector or 2-D array given as nested lists or tuples.
+@return: The result as a list, or a nested list for 2-D operands.
+@raises ValueError: If the shapes of a and b cannot be broadcast together.
+The innermost loop is a map() over a C-level operator, so no Python code
+runs per element.
+"""
+def elementwise(op: Callable, a: Operand, b: Operand) -> Operand:
+    try:
+        return _broadcast(op, a, b, _ndim(a), _ndim(b))
+    except _ShapeMismatch:
+        raise ValueError(f"Operands could not be broadcast together with shapes {_shape(a)} and {_shape(b)}.") from None
+
+def is_vector(value: Operand) -> bool:
+    return isinstance(value, _SEQUENCE_TYPES)
+
+"""
+@param value: Scalar, vector or 2-D array.
+@return: True if the value, or any element of it, is zero.
+"""
+def contains_zero(value: Operand) -> bool:
+    if not is_vector(value):
+        return value == 0
+    if _ndim(value) > 1:
+        return any(map(contains_zero, value))
+    return 0 in value
+
 
 class Operation:
     """
     parameters:
-    @float: a
-    @float: b
-    returns float
+    @Operand: a
+    @Operand: b
+    returns Operand
     """
     @staticmethod
-    def addition(a: float, b: float) -> float:
+    def addition(a: Operand, b: Operand) -> Operand:
+        if is_vector(a) or is_vector(b):
+            return elementwise(operator.add, a, b)
         return a + b
     
     """
     parameters:
-    @float: a
-    @float: b
-    returns float
+    @Operand: a
+    @Operand: b
+    returns Operand
     """
     @staticmethod
-    def subtraction(a: float, b: float) -> float:
+    def subtraction(a: Operand, b: Operand) -> Operand:
         """
         Finds the difference between numbers a and b and returns the result
         """
+        if is_vector(a) or is_vector(b):
+            return elementwise(operator.sub, a, b)
         return a - b
 
     """
     parameters:
-    @float: a
-    @float: b
-    returns float
+    @Operand: a
+    @Operand: b
+    returns Operand
     """
     @staticmethod
-    def multiplication(a: float, b: float) -> float:
+    def multiplication(a: Operand, b: Operand) -> Operand:
         """
         Calculates the product between numbers a and b and returns the result.
         """
+        if is_vector(a) or is_vector(b):
+            return elementwise(operator.mul, a, b)
         return a * b
 
     """
     parameters:
-    @float: a
-    @float: b
-    returns float
+    @Operand: a
+    @Operand: b
+    returns Operand
     raises ValueError
     """
     @staticmethod
-    def division(a: float, b: float) -> float:
+    def division(a: Operand, b: Operand) -> Operand:
         """
         Calculates the quotient between numbers a and b and returns the result.
         Before dividing a with b, there is a check if b is equal to zero. If b
         is zero the function raises a ValueError with a message saying
-        "Division by zero is not allowed."
+        "Division by zero is not allowed." The same error is raised when any
+        element of a vector divisor is zero.
         """
+        if is_vector(a) or is_vector(b):
+            try:
+                return elementwise(operator.truediv, a, b)
+            except ZeroDivisionError:
+                raise ValueError("Division by zero is not allowed.") from None
         if b == 0:
             raise ValueError("Division by zero is not allowed.")
-        return a / b
\ No newline at end of file
+        return a / b
+
+    """
+    parameters:
+    @Operand: a
+    @Operand: b
+    returns Operand or Failure
+    """
+    @staticmethod
+    def try_division(a: Operand, b: Operand) -> Result:
+        """
+        Non-raising version of division. Instead of raising a ValueError when
+        b is zero it returns the DIVISION_BY_ZERO failure, and vector operands
+        whose shapes cannot be broadcast give a Failure with the same message
+        as the ValueError from division.
+        """
+        if is_vector(a) or is_vector(b):
+            try:
+                return elementwise(operator.truediv, a, b)
+            except ZeroDivisionError:
+                return DIVISION_BY_ZERO
+            except ValueError as e:
+                return Failure(str(e))
+        if b == 0:
+            return DIVISION_BY_ZERO
+        return a / b
@@ -0,0 +1,185 @@
+import os
+import sys
+import time
+from collections import Counter
+from contextlib import nullcontext
+from typing import Any, Dict, List, Optional, Tuple
+
+# cProfile, json and threading are imported only when a session needs them,
+# so that creating a Profiler does not slow down calculator startup.
+
+MODES = ('spans', 'cprofile', 'sampling')
+
+_NULL_SPAN = nullcontext()
+
+class _Span:
+    """
+    Timing span handed out by Profiler.span while profiling is on.
+    """
+    __slots__ = ('_profiler', '_name', '_path', '_start')
+
+    def __init__(self, profiler: 'Profiler', name: str) -> None:
+        self._profiler = profiler
+        self._name = name
+
+    def __enter__(self) -> '_Span':
+        stack = self._profiler._stack
+        stack.append(self._name)
+        self._path = ';'.join(stack)
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        end = time.perf_counter_ns()
+        self._profiler._stack.pop()
+        self._profiler._spans.append((self._path, self._start, end))
+
+class Profiler:
+    """
+    Low-overhead profiler for the calculator REPL.
+
+    Code under test marks its stages with `with profiler.span(name):`. While
+    the profiler is off a span is a shared no-op context manager. While it is
+    on every span is timed, and depending on the mode the whole session also
+    runs under cProfile ('cprofile') or a stack-sampling thread ('sampling').
+    Results can be exported as a Chrome trace, as collapsed stacks for
+    flamegraph tools, or as a pstats dump.
+    """
+    def __init__(self, interval: float = 0.001) -> None:
+        self.interval: float = interval
+        self.mode: Optional[str] = None
+        self._stack: List[str] = []
+        self._spans: List[Tuple[str, int, int]] = []
+        self._samples: Counter = Counter()
+        self._cprofile: Optional[Any] = None
+        self._sampler: Optional[Any] = None
+        self._stop_sampling: Optional[Any] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode is not None
+
+    """
+    Turn profiling on. Data from earlier sessions is discarded.
+    @param mode: One of 'spans', 'cprofile' or 'sampling'.
+    @raises ValueError: If the mode is not supported or profiling is already on.
+    """
+    def start(self, mode: str = 'spans') -> None:
+        if mode not in MODES:
+            raise ValueError(f"Unsupported profiling mode: '{mode}'. Available modes: {', '.join(MODES)}")
+        if self.enabled:
+            raise ValueError("Profiling is already on.")
+        self._stack.clear()
+        self._spans.clear()
+        self._samples.clear()
+        self._cprofile = None
+        self.mode = mode
+        if mode == 'cprofile':
+            import cProfile
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        elif mode == 'sampling':
+            import threading
+            self._stop_sampling = threading.Event()
+            self._sampler = threading.Thread(target=self._sample, args=(threading.get_ident(),),
+                                             name="profiler-sampler", daemon=True)
+            self._sampler.start()
+
+    """
+    Turn profiling off. The collected data stays available for export.
+    """
+    def stop(self) -> None:
+        if self._cprofile is not None:
+            self._cprofile.disable()
+        if self._sampler is not None:
+            self._stop_sampling.set()
+            self._sampler.join()
+            self._sampler = None
+        self.mode = None
+
+    """
+    Time a stage of work.
+    @param name: The name of the stage (e.g., 'parse', 'execute').
+    @return: A context manager that records the span while profiling is on.
+    """
+    def span(self, name: str):
+        if self.mode is None:
+            return _NULL_SPAN
+        return _Span(self, name)
+
+    def chrome_trace(self) -> Dict:
+        import threading
+        pid = os.getpid()
+        tid = threading.get_ident()
+        events = [
+            {"name": path.rsplit(';', 1)[-1], "cat": "calculator", "ph": "X", "pid": pid, "tid": tid,
+             "ts": start / 1000, "dur": (end - start) / 1000}
+            for path, start, end in self._spans
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    """
+    Collapsed stacks for flamegraph tools.
+    @return: Mapping of 'outer;inner' stacks to their weight. After a sampling
+    session the weight is the number of samples, otherwise the self time of
+    the span in microseconds.
+    """
+    def collapsed_stacks(self) -> Dict[str, int]:
+        if self._samples:
+            return dict(self._samples)
+        self_times: Dict[str, int] = {}
+        for path, start, end in self._spans:
+            duration = end - start
+            self_times[path] = self_times.get(path, 0) + duration
+            if ';' in path:
+                parent = path.rsplit(';', 1)[0]
+                self_times[parent] = self_times.get(parent, 0) - duration
+        return {path: max(duration // 1000, 0) for path, duration in self_times.items()}
+
+    def export_chrome_trace(self, path: str) -> None:
+        import json
+        with open(path, 'w') as trace_file:
+            json.dump(self.chrome_trace(), trace_file)
+
+    def export_collapsed(self, path: str) -> None:
+        with open(path, 'w') as collapsed_file:
+            for stack, weight in self.collapsed_stacks().items():
+                collapsed_file.write(f"{stack} {weight}\n")
+
+    """
+    Write the cProfile statistics of the current or last 'cprofile' session.
+    Exporting while the session is running writes a snapshot and keeps profiling.
+    @raises ValueError: If there is no cProfile data.
+    """
+    def export_pstats(self, path: str) -> None:
+        if self._cprofile is None:
+            raise ValueError("No cProfile data. Start the profiler in 'cprofile' mode first.")
+        try:
+            self._cprofile.dump_stats(path)
+        finally:
+            # dump_stats disables the profiler to take its snapshot.
+            if self.mode == 'cprofile':
+                self._cprofile.enable()
+
+    """
+    Export the collected data, picking the format from the file extension:
+    .json for a Chrome trace, .prof for pstats and collapsed stacks otherwise.
+    """
+    def export(self, path: str) -> None:
+        if path.endswith('.json'):
+            self.export_chrome_trace(path)
+        elif path.endswith('.prof'):
+            self.export_pstats(path)
+        else:
+            self.export_collapsed(path)
+
+    def _sample(self, thread_id: int) -> None:
+        while not self._stop_sampling.wait(self.interval):
+            frame = sys._current_frames().get(thread_id)
+            stack: List[str] = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                frame = frame.f_back
+            if stack:
+                self._samples[';'.join(reversed(stack))] += 1
@@ -0,0 +1,221 @@
+import argparse
+import heapq
+import math
+import os
+import re
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from app.calculation import CalculationFactory
+from app.calculator import parse_operand, tokenize
+from app.operation import Failure, Operand, Result
+
+_INDEX_PREFIX = re.compile(r"^\d+\.\s+")
+
+# Lines the REPL's history command prints around the entries themselves.
+_HISTORY_HEADERS = frozenset(("Calculation History:", "No calculations performed yet."))
+
+# (operation, a, b, expected); expected is None when an error was recorded
+Record = Tuple[str, Operand, Operand, Optional[Operand]]
+
+class Mismatch:
+    """
+    A recorded line whose result differs from the current one, or that
+    could not be parsed.
+    """
+    __slots__ = ('line_number', 'line', 'reason')
+
+    def __init__(self, line_number: int, line: str, reason: str) -> None:
+        self.line_number: int = line_number
+        self.line: str = line
+        self.reason: str = reason
+
+    def __str__(self) -> str:
+        return f"line {self.line_number}: {self.line} -> {self.reason}"
+
+class ReplayReport:
+    """
+    Totals of a replay run. Only the first `max_mismatches` mismatches are
+    kept so that reports stay small for inputs of any size.
+    """
+    def __init__(self, max_mismatches: int = 100) -> None:
+        self.max_mismatches: int = max_mismatches
+        self.total: int = 0
+        self.matched: int = 0
+        self.mismatched: int = 0
+        self.invalid: int = 0
+        self.mismatches: List[Mismatch] = []
+        self.elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.mismatched == 0 and self.invalid == 0
+
+    @property
+    def throughput(self) -> float:
+        return self.total / self.elapsed if self.elapsed else 0.0
+
+    def add_mismatch(self, mismatch: Mismatch) -> None:
+        if len(self.mismatches) < self.max_mismatches:
+            self.mismatches.append(mismatch)
+
+    def merge(self, other: 'ReplayReport') -> None:
+        self.total += other.total
+        self.matched += other.matched
+        self.mismatched += other.mismatched
+        self.invalid += other.invalid
+        for mismatch in other.mismatches:
+            self.add_mismatch(mismatch)
+
+    def summary(self) -> str:
+        lines = [
+            f"Replayed {self.total} records in {self.elapsed:.3f}s ({self.throughput:.0f} records/s)",
+            f"Matched: {self.matched}, mismatched: {self.mismatched}, invalid: {self.invalid}",
+        ]
+        lines.extend(str(mismatch) for mismatch in self.mismatches)
+        hidden = self.mismatched + self.invalid - len(self.mismatches)
+        if hidden > 0:
+            lines.append(f"... and {hidden} more")
+        return "\n".join(lines)
+
+"""
+Parse one recorded line.
+@param line: Either '<operation> <a> <b> [=] <expected>' or a history entry
+such as '1. AddCalculation: 5.0 Add 4.0 = 9.0'. The expected value can be
+'error' for a calculation that failed when it was recorded.
+@param class_names: Mapping of calculation class names to registered types.
+@return: The operation, both operands and the expected result.
+@raises ValueError: If the line cannot be parsed.
+"""
+def parse_record(line: str, class_names: Dict[str, str]) -> Record:
+    tokens = tokenize(_INDEX_PREFIX.sub("", line.strip()))
+    if tokens and tokens[0].endswith("Calculation:"):
+        if len(tokens) != 6 or tokens[4] != "=":
+            raise ValueError("Expected '<Name>Calculation: <a> <Name> <b> = <result>'")
+        operation = class_names.get(tokens[0][:-1], tokens[2].lower())
+        a_str, b_str, expected_str = tokens[1], tokens[3], tokens[5]
+    else:
+        tokens = [token for token in tokens if token != "="]
+        if len(tokens) != 4:
+            raise ValueError("Expected '<operation> <a> <b> <expected>'")
+        operation, a_str, b_str, expected_str = tokens
+    expected = None if expected_str.lower() == "error" else parse_operand(expected_str)
+    return operation, parse_operand(a_str), parse_operand(b_str), expected
+
+def _is_close(actual: Result, expected: Operand, rel_tol: float, abs_tol: float) -> bool:
+    if isinstance(expected, list):
+        return (isinstance(actual, list) and len(actual) == len(expected)
+                and all(_is_close(x, y, rel_tol, abs_tol) for x, y in zip(actual, expected)))
+    if isinstance(actual, (list, Failure)):
+        return False
+    if math.isnan(expected):
+        return math.isnan(actual)
+    return math.isclose(actual, expected, rel_tol=rel_tol, abs_tol=abs_tol)
+
+def _replay_chunk(chunk: List[Tuple[int, str]], rel_tol: float, abs_tol: float,
+                  max_mismatches: int) -> ReplayReport:
+    report = ReplayReport(max_mismatches)
+    class_names = {calculation_class.__name__: name
+                   for name, calculation_class in CalculationFactory._calculations.items()}
+    records: List[Tuple[int, str, Record]] = []
+    invalid: List[Mismatch] = []
+    mismatched: List[Mismatch] = []
+    for line_number, line in chunk:
+        report.total += 1
+        try:
+            records.append((line_number, line, parse_record(line, class_names)))
+        except ValueError as e:
+            report.invalid += 1
+            invalid.append(Mismatch(line_number, line, f"invalid record: {e}"))
+
+    results = CalculationFactory.evaluate_batch(record[:3] for _, _, record in records)
+    for (line_number, line, record), actual in zip(records, results):
+        expected = record[3]
+        if expected is None:
+            matched = isinstance(actual, Failure)
+        else:
+            matched = _is_close(actual, expected, rel_tol, abs_tol)
+        if matched:
+            report.matched += 1
+        else:
+            report.mismatched += 1
+            shown = f"error: {actual}" if isinstance(actual, Failure) else actual
+            mismatched.append(Mismatch(line_number, line,
+                                       f"expected {'error' if expected is None else expected}, got {shown}"))
+
+    for mismatch in heapq.merge(invalid, mismatched, key=lambda mismatch: mismatch.line_number):
+        report.add_mismatch(mismatch)
+    return report
+
+def _chunks(lines: Iterable[str], chunk_size: int) -> Iterator[List[Tuple[int, str]]]:
+    chunk: List[Tuple[int, str]] = []
+    for line_number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line or line.startswith("#") or line in _HISTORY_HEADERS:
+            continue
+        chunk.append((line_number, line))
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+"""
+Re-run recorded calculations and compare them with the recorded results.
+@param lines: The recorded lines; read lazily, so a file object works for any size.
+Blank lines, '#' comments and the headers printed by the history command are skipped.
+@param rel_tol: Relative tolerance for comparing floats.
+@param abs_tol: Absolute tolerance for comparing floats.
+@param workers: Number of worker processes, None for one per CPU or 0 to run in this process.
+@param chunk_size: Number of lines sent to a worker at a time.
+@param max_mismatches: Number of mismatches kept in the report.
+@return: A ReplayReport with the totals, the first mismatches and the throughput.
+@raises ValueError: If chunk_size is less than 1.
+"""
+def replay(lines: Iterable[str], rel_tol: float = 1e-9, abs_tol: float = 0.0,
+           workers: Optional[int] = None, chunk_size: int = 10000,
+           max_mismatches: int = 100) -> ReplayReport:
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be at least 1.")
+    started = time.perf_counter()
+    report = ReplayReport(max_mismatches)
+    chunks = _chunks(lines, chunk_size)
+    if workers == 0:
+        for chunk in chunks:
+            report.merge(_replay_chunk(chunk, rel_tol, abs_tol, max_mismatches))
+    else:
+        # Keep a bounded number of chunks in flight so input is streamed, not loaded.
+        in_flight = 2 * (workers or os.cpu_count() or 1)
+        with ProcessPoolExecutor(workers) as executor:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(executor.submit(_replay_chunk, chunk, rel_tol, abs_tol, max_mismatches))
+                if len(pending) >= in_flight:
+                    report.merge(pending.popleft().result())
+            while pending:
+                report.merge(pending.popleft().result())
+    report.elapsed = time.perf_counter() - started
+    return report
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.replay",
+                                     description="Replay recorded calculations and diff the results.")
+    parser.add_argument("path", help="recorded calculations, or - for standard input")
+    parser.add_argument("--rel-tol", type=float, default=1e-9, help="relative float tolerance")
+    parser.add_argument("--abs-tol", type=float, default=0.0, help="absolute float tolerance")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes, 0 to run in-process")
+    parser.add_argument("--chunk-size", type=int, default=10000, help="lines per worker task")
+    parser.add_argument("--max-mismatches", type=int, default=100, help="mismatches to show")
+    args = parser.parse_args(argv)
+
+    options = dict(rel_tol=args.rel_tol, abs_tol=args.abs_tol, workers=args.workers,
+                   chunk_size=args.chunk_size, max_mismatches=args.max_mismatches)
+    if args.path == "-":
+        report = replay(sys.stdin, **options)
+    else:
+        with open(args.path) as recorded:
+            report = replay(recorded, **options)
+    print(report.summary())
+    return 0 if report.ok else 1
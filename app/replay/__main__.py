@@ -0,0 +1,4 @@
+import sys
+from app.replay import main
+
+sys.exit(main())
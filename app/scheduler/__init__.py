@@ -0,0 +1,209 @@
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future
+from typing import List, Optional, Tuple
+from app.calculation import Calculation, CalculationFactory
+from app.operation import Operand
+
+class Job:
+    """
+    A queued calculation together with its scheduling information.
+    """
+    __slots__ = ('calculation', 'priority', 'deadline', 'submitted_at', 'future', 'queued')
+
+    def __init__(self, calculation: Calculation, priority: int, deadline: Optional[float]) -> None:
+        self.calculation: Calculation = calculation
+        self.priority: int = priority
+        self.deadline: Optional[float] = deadline
+        self.submitted_at: float = time.perf_counter()
+        self.future: Future = Future()
+        self.queued: bool = True
+
+class SchedulerStats:
+    """
+    Snapshot of the scheduler counters. Times are in seconds.
+    """
+    def __init__(self, queue_depth: int, workers: int, completed: int, failed: int,
+                 cancelled: int, expired: int, total_wait: float, max_wait: float,
+                 total_run: float, max_run: float) -> None:
+        self.queue_depth: int = queue_depth
+        self.workers: int = workers
+        self.completed: int = completed
+        self.failed: int = failed
+        self.cancelled: int = cancelled
+        self.expired: int = expired
+        self.max_wait: float = max_wait
+        self.max_run: float = max_run
+        started = completed + failed
+        dispatched = started + expired
+        self.mean_wait: float = total_wait / dispatched if dispatched else 0.0
+        self.mean_run: float = total_run / started if started else 0.0
+
+    def __str__(self) -> str:
+        return (f"queue depth: {self.queue_depth}, workers: {self.workers}, "
+                f"completed: {self.completed}, failed: {self.failed}, "
+                f"cancelled: {self.cancelled}, expired: {self.expired}, "
+                f"wait mean/max: {self.mean_wait:.6f}/{self.max_wait:.6f}s, "
+                f"run mean/max: {self.mean_run:.6f}/{self.max_run:.6f}s")
+
+class JobScheduler:
+    """
+    Runs calculations from a priority queue on a pool of worker threads.
+
+    Jobs with a higher priority are dispatched first. Among jobs with the
+    same priority the one with the earliest deadline goes first, then the
+    one submitted first. A job that is still queued when its deadline
+    passes is not run and its future fails with a TimeoutError.
+
+    Cancelling a queued job leaves it in the heap as a tombstone that the
+    workers skip, so cancel() stays O(1); tombstones are not counted in the
+    queue depth.
+    """
+    def __init__(self, workers: int = 4, autostart: bool = True) -> None:
+        if workers < 1:
+            raise ValueError("The scheduler needs at least one worker.")
+        self._workers: int = workers
+        self._threads: List[threading.Thread] = []
+        self._queue: List[Tuple[int, float, int, Job]] = []
+        self._tombstones: int = 0
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._shutdown: bool = False
+        self._completed: int = 0
+        self._failed: int = 0
+        self._cancelled: int = 0
+        self._expired: int = 0
+        self._total_wait: float = 0.0
+        self._max_wait: float = 0.0
+        self._total_run: float = 0.0
+        self._max_run: float = 0.0
+        if autostart:
+            self.start()
+
+    def __enter__(self) -> 'JobScheduler':
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+
+    """
+    Start the worker threads. Jobs submitted before start() wait in the queue.
+    """
+    def start(self) -> None:
+        with self._condition:
+            if self._threads:
+                return
+            for idx in range(self._workers):
+                thread = threading.Thread(target=self._work, name=f"calculation-worker-{idx}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    """
+    Queue a calculation to run in the background.
+    @param calculation_type: The type of calculation (e.g., 'add', 'subtract').
+    @param a: The first operand.
+    @param b: The second operand.
+    @param priority: Jobs with a higher priority run first.
+    @param deadline: Seconds from now by which the job has to start, or None.
+    @return: A future that resolves to the result of the calculation.
+    @raises ValueError: If the calculation type is not supported.
+    @raises RuntimeError: If the scheduler has been shut down.
+    """
+    def submit(self, calculation_type: str, a: Operand, b: Operand,
+               priority: int = 0, deadline: Optional[float] = None) -> Future:
+        calculation = CalculationFactory.create_calculation(calculation_type, a, b)
+        job = Job(calculation, priority, None if deadline is None else time.perf_counter() + deadline)
+        sort_deadline = float('inf') if job.deadline is None else job.deadline
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("Cannot submit jobs after shutdown.")
+            heapq.heappush(self._queue, (-priority, sort_deadline, next(self._sequence), job))
+            self._condition.notify()
+        job.future.add_done_callback(lambda future: self._on_done(job))
+        return job.future
+
+    """
+    Stop the scheduler.
+    @param wait: Block until the queued jobs are finished and the workers exit.
+    @param cancel_pending: Cancel the jobs that have not started yet.
+    """
+    def shutdown(self, wait: bool = True, cancel_pending: bool = False) -> None:
+        with self._condition:
+            self._shutdown = True
+            if cancel_pending:
+                for *_, job in self._queue:
+                    job.future.cancel()
+                self._queue.clear()
+                self._tombstones = 0
+            self._condition.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def stats(self) -> SchedulerStats:
+        with self._condition:
+            return SchedulerStats(len(self._queue) - self._tombstones, self._workers, self._completed, self._failed,
+                                  self._cancelled, self._expired, self._total_wait, self._max_wait,
+                                  self._total_run, self._max_run)
+
+    def _work(self) -> None:
+        while True:
+            with self._condition:
+                while not self._queue and not self._shutdown:
+                    self._condition.wait()
+                if not self._queue:
+                    return
+                job = heapq.heappop(self._queue)[-1]
+                if not job.queued:
+                    self._tombstones -= 1
+                    continue
+                job.queued = False
+            self._run(job)
+
+    # Count a job cancelled while queued; it stays in the heap as a tombstone.
+    def _on_done(self, job: Job) -> None:
+        if not job.future.cancelled():
+            return
+        with self._condition:
+            self._cancelled += 1
+            if job.queued:
+                job.queued = False
+                self._tombstones += 1
+
+    def _run(self, job: Job) -> None:
+        # The job can still be cancelled between leaving the queue and starting.
+        if not job.future.set_running_or_notify_cancel():
+            return
+
+        started = time.perf_counter()
+        wait = started - job.submitted_at
+        if job.deadline is not None and started > job.deadline:
+            job.future.set_exception(TimeoutError("Job missed its deadline before it could run."))
+            self._record(wait, None, expired=True)
+            return
+
+        try:
+            result = job.calculation.execute()
+        except Exception as e:
+            job.future.set_exception(e)
+            self._record(wait, time.perf_counter() - started, failed=True)
+        else:
+            job.future.set_result(result)
+            self._record(wait, time.perf_counter() - started)
+
+    def _record(self, wait: float, run: Optional[float], failed: bool = False, expired: bool = False) -> None:
+        with self._condition:
+            self._total_wait += wait
+            self._max_wait = max(self._max_wait, wait)
+            if expired:
+                self._expired += 1
+                return
+            self._total_run += run
+            self._max_run = max(self._max_run, run)
+            if failed:
+                self._failed += 1
+            else:
+                self._completed += 1
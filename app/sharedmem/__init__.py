@@ -0,0 +1,117 @@
+from array import array
+from contextlib import ExitStack
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from typing import Iterable, List, Optional, Tuple, Union
+from app.calculation import CalculationFactory
+
+_ITEM_SIZE = array('d').itemsize
+
+# (calculation_type, a_name, b_name or scalar, out_name, start, stop)
+SliceTask = Tuple[str, str, Union[str, float], str, int, int]
+
+class SharedArray:
+    """
+    Array of floats that lives in shared memory.
+
+    The process that creates the array owns it and unlinks the memory on
+    close. Other processes attach to it by name and only unmap it, so the
+    data is written once and never pickled.
+    """
+    def __init__(self, length: int, name: Optional[str] = None) -> None:
+        if length < 0:
+            raise ValueError("Shared array length cannot be negative.")
+        self._owner: bool = name is None
+        if self._owner:
+            self._memory = SharedMemory(create=True, size=max(length * _ITEM_SIZE, 1))
+        else:
+            self._memory = SharedMemory(name=name)
+        self.length: int = length
+        self.values: memoryview = self._memory.buf[:length * _ITEM_SIZE].cast('d')
+
+    """
+    Create a shared array and copy values into it.
+    @param values: The floats to share.
+    @return: A new SharedArray owned by the calling process.
+    """
+    @classmethod
+    def from_values(cls, values: Iterable[float]) -> 'SharedArray':
+        data = array('d', values)
+        shared = cls(len(data))
+        shared.values[:] = data
+        return shared
+
+    @property
+    def name(self) -> str:
+        return self._memory.name
+
+    def tolist(self) -> List[float]:
+        return self.values.tolist()
+
+    def close(self) -> None:
+        self.values.release()
+        self._memory.close()
+        if self._owner:
+            self._memory.unlink()
+
+    def __enter__(self) -> 'SharedArray':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.length
+
+"""
+Run a calculation over shared operand buffers, writing into a shared result buffer.
+@param calculation_type: The type of calculation (e.g., 'add', 'divide').
+@param a: The first operands.
+@param b: The second operands, or a single number applied to every row.
+@param out: The buffer the results are written to.
+@param processes: Number of worker processes, or 0 to compute in this process.
+@param chunk_size: Number of rows each worker computes per task.
+@raises ValueError: If the calculation type is not supported, the buffers
+differ in length or a calculation fails.
+@raises ZeroDivisionError: If a 'divide' calculation has a zero divisor.
+Workers receive only a small SliceTask describing where their rows are and
+read their operands straight from shared memory. The calculation returns its
+result as a list, so each chunk still builds one temporary list (and an array
+copy of it) before it is written into the result buffer; chunk_size bounds
+that memory. The calculation type has to accept vector operands, which all
+built-in types do.
+"""
+def compute_shared(calculation_type: str, a: SharedArray, b: Union[SharedArray, float],
+                   out: SharedArray, processes: Optional[int] = None, chunk_size: int = 65536) -> None:
+    # Fail fast on an unsupported type before any worker is started.
+    CalculationFactory.create_calculation(calculation_type, 0.0, 1.0)
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be at least 1.")
+    lengths = {len(a), len(out)} | ({len(b)} if isinstance(b, SharedArray) else set())
+    if len(lengths) != 1:
+        raise ValueError("Shared operand and result buffers must have the same length.")
+
+    b_descriptor = b.name if isinstance(b, SharedArray) else float(b)
+    tasks = [(calculation_type, a.name, b_descriptor, out.name, start, min(start + chunk_size, len(a)))
+             for start in range(0, len(a), chunk_size)]
+    if processes == 0:
+        for task in tasks:
+            _compute_slice(task)
+        return
+    with get_context().Pool(processes) as pool:
+        for _ in pool.imap_unordered(_compute_slice, tasks):
+            pass
+
+def _compute_slice(task: SliceTask) -> None:
+    calculation_type, a_name, b_descriptor, out_name, start, stop = task
+    with ExitStack() as stack:
+        a = stack.enter_context(SharedArray(stop, a_name))
+        out = stack.enter_context(SharedArray(stop, out_name))
+        a_rows = stack.enter_context(a.values[start:stop])
+        if isinstance(b_descriptor, str):
+            b_shared = stack.enter_context(SharedArray(stop, b_descriptor))
+            b = stack.enter_context(b_shared.values[start:stop])
+        else:
+            b = b_descriptor
+        result = CalculationFactory.create_calculation(calculation_type, a_rows, b).execute()
+        out.values[start:stop] = array('d', result)
@@ -0,0 +1,153 @@
+import math
+import operator
+from collections import Counter
+from itertools import repeat
+from typing import Callable, Dict, List, Sequence, Tuple
+from app.calculation import (
+    CalculationFactory,
+    AddCalculation,
+    SubtractCalculation,
+    MultiplyCalculation,
+    DivideCalculation,
+)
+from app.operation import Operand
+
+_SCALAR_TYPES = frozenset((float, int))
+
+def _divide(a: float, b: float) -> float:
+    if b == 0:
+        raise ZeroDivisionError("Cannot divide by zero.")
+    return a / b
+
+# Kernels that give the same result as the built-in calculations on scalars.
+_KERNELS: Dict[type, Callable[[float, float], float]] = {
+    AddCalculation: operator.add,
+    SubtractCalculation: operator.sub,
+    MultiplyCalculation: operator.mul,
+    DivideCalculation: _divide,
+}
+
+# Column kernels check for a zero divisor once up front instead of per row.
+_COLUMN_KERNELS: Dict[type, Callable[[float, float], float]] = {**_KERNELS, DivideCalculation: operator.truediv}
+
+def _exact_reciprocal(divisor: float) -> bool:
+    """
+    True when x * (1 / divisor) is bit-for-bit equal to x / divisor, which is
+    the case for powers of two whose reciprocal does not overflow.
+    """
+    reciprocal = 1.0 / divisor
+    return math.isfinite(reciprocal) and abs(math.frexp(divisor)[0]) == 0.5
+
+class Specializer:
+    """
+    Evaluates calculations through CalculationFactory and replaces hot paths
+    with specialized closures.
+
+    Every (calculation type, operand type, operand type) combination is
+    counted. Once a combination has been seen `threshold` times, and it is a
+    built-in calculation on int or float operands, later calls skip the
+    factory and run a bare operator kernel. Custom calculation types, vector
+    operands and rare combinations always go through the factory. If the
+    registry no longer maps the name to the class that was specialized, the
+    specialization is dropped again.
+    """
+    def __init__(self, threshold: int = 100) -> None:
+        if threshold < 1:
+            raise ValueError("Specialization threshold must be at least 1.")
+        self.threshold: int = threshold
+        self._counts: Counter = Counter()
+        self._specialized: Dict[Tuple[str, type, type], Tuple[str, type, Callable]] = {}
+        self.specialized_calls: int = 0
+        self.fallback_calls: int = 0
+        self.specializations: int = 0
+        self.deoptimizations: int = 0
+        self.column_calls: int = 0
+        self.reciprocal_columns: int = 0
+
+    """
+    Evaluate a single calculation.
+    @param calculation_type: The type of calculation (e.g., 'add', 'subtract').
+    @param a: The first operand.
+    @param b: The second operand.
+    @return: The same result CalculationFactory would produce.
+    @raises ValueError: If the calculation type is not supported.
+    @raises ZeroDivisionError: If division by zero is attempted.
+    """
+    def evaluate(self, calculation_type: str, a: Operand, b: Operand) -> Operand:
+        key = (calculation_type, type(a), type(b))
+        entry = self._specialized.get(key)
+        if entry is not None:
+            name, calculation_class, kernel = entry
+            if CalculationFactory._calculations.get(name) is calculation_class:
+                self.specialized_calls += 1
+                return kernel(a, b)
+            del self._specialized[key]
+            self._counts[key] = 0
+            self.deoptimizations += 1
+
+        self._counts[key] += 1
+        if self._counts[key] == self.threshold:
+            self._specialize(key)
+        self.fallback_calls += 1
+        return CalculationFactory.create_calculation(calculation_type, a, b).execute()
+
+    """
+    Evaluate one calculation for every value in a column against a constant.
+    @param calculation_type: The type of calculation (e.g., 'divide').
+    @param values: The first operands.
+    @param b: The second operand, shared by every row.
+    @return: A list with one result per value.
+    @raises ValueError: If the calculation type is not supported.
+    @raises ZeroDivisionError: If division by zero is attempted.
+    Dividing float values by a power of two is turned into multiplying by its
+    reciprocal, which gives identical results; other divisors keep the division.
+    """
+    def evaluate_column(self, calculation_type: str, values: Sequence[float], b: float) -> List[Operand]:
+        name = calculation_type.lower()
+        calculation_class = CalculationFactory._calculations.get(name)
+        kernel = _COLUMN_KERNELS.get(calculation_class)
+        value_types = set(map(type, values))
+        if kernel is None or type(b) not in _SCALAR_TYPES or not value_types <= _SCALAR_TYPES:
+            self.fallback_calls += len(values)
+            return [CalculationFactory.create_calculation(calculation_type, value, b).execute() for value in values]
+
+        self.column_calls += 1
+        if calculation_class is DivideCalculation:
+            if b == 0:
+                if values:
+                    raise ZeroDivisionError("Cannot divide by zero.")
+                return []
+            # Large ints would be rounded to float before the multiplication.
+            if value_types <= {float} and _exact_reciprocal(b):
+                self.reciprocal_columns += 1
+                return list(map(operator.mul, values, repeat(1.0 / b)))
+        return list(map(kernel, values, repeat(b)))
+
+    def counters(self) -> Dict[str, int]:
+        return {
+            "specialized_calls": self.specialized_calls,
+            "fallback_calls": self.fallback_calls,
+            "specializations": self.specializations,
+            "deoptimizations": self.deoptimizations,
+            "column_calls": self.column_calls,
+            "reciprocal_columns": self.reciprocal_columns,
+        }
+
+    """
+    @return: The specialized combinations, e.g. "add(float, float)".
+    """
+    def specialized_types(self) -> List[str]:
+        return [f"{name}({a_type.__name__}, {b_type.__name__})"
+                for name, a_type, b_type in self._specialized]
+
+    def _specialize(self, key: Tuple[str, type, type]) -> None:
+        calculation_type, a_type, b_type = key
+        if a_type not in _SCALAR_TYPES or b_type not in _SCALAR_TYPES:
+            return
+        name = calculation_type.lower()
+        calculation_class = CalculationFactory._calculations.get(name)
+        kernel = _KERNELS.get(calculation_class)
+        if kernel is None:
+            return
+        self._specialized[key] = (name, calculation_class, kernel)
+        self.specializations += 1
@@ -0,0 +1,231 @@
+import math
+from typing import Any, Dict, List, Optional
+from app.operation import Operand, is_vector
+
+class RunningStats:
+    """
+    Count, mean, variance, min and max of a stream, updated in O(1) per value
+    with Welford's algorithm. Two instances can be merged exactly.
+    """
+    def __init__(self) -> None:
+        self.count: int = 0
+        self.mean: float = 0.0
+        self.min: float = math.inf
+        self.max: float = -math.inf
+        self._m2: float = 0.0
+
+    def update(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    """
+    Combine the statistics of another stream into this one.
+    @param other: Statistics from another session or worker process.
+    """
+    def merge(self, other: 'RunningStats') -> None:
+        if other.count == 0:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self._m2 += other._m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def pvariance(self) -> float:
+        return self._m2 / self.count if self.count else math.nan
+
+    @property
+    def variance(self) -> float:
+        return self._m2 / (self.count - 1) if self.count > 1 else math.nan
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.variance)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"count": self.count, "mean": self.mean, "m2": self._m2, "min": self.min, "max": self.max}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'RunningStats':
+        stats = cls()
+        stats.count = data["count"]
+        stats.mean = data["mean"]
+        stats._m2 = data["m2"]
+        stats.min = data["min"]
+        stats.max = data["max"]
+        return stats
+
+class KLLSketch:
+    """
+    Mergeable quantile sketch (Karnin, Lang and Liberty).
+
+    Values are kept in a stack of compactors. When a level fills up it is
+    sorted and every other value is promoted to the next level with twice
+    the weight, so memory stays O(k) however many values are added and each
+    update is amortized O(1). Rank error is roughly 1/k; the quantiles are
+    exact while fewer than about k values have been added.
+
+    The random module is imported on the first compaction, not on import,
+    so that the calculator starts without it.
+    """
+    def __init__(self, k: int = 200, seed: Optional[int] = None) -> None:
+        if k < 8:
+            raise ValueError("Sketch size k must be at least 8.")
+        self.k: int = k
+        self.count: int = 0
+        self._seed: Optional[int] = seed
+        self._random: Optional[Any] = None
+        self._compactors: List[List[float]] = []
+        self._size: int = 0
+        self._max_size: int = 0
+        self._grow()
+
+    def update(self, value: float) -> None:
+        self._compactors[0].append(value)
+        self._size += 1
+        self.count += 1
+        while self._size >= self._max_size:
+            self._compress()
+
+    """
+    Combine another sketch into this one.
+    @param other: A sketch from another session or worker process.
+    """
+    def merge(self, other: 'KLLSketch') -> None:
+        while len(self._compactors) < len(other._compactors):
+            self._grow()
+        for height, items in enumerate(other._compactors):
+            self._compactors[height].extend(items)
+        self.count += other.count
+        self._size = sum(len(items) for items in self._compactors)
+        while self._size >= self._max_size:
+            self._compress()
+
+    """
+    Estimate a quantile.
+    @param q: The quantile between 0 and 1 (e.g., 0.5 for the median).
+    @return: The estimated value, or nan if the sketch is empty.
+    @raises ValueError: If q is outside [0, 1].
+    """
+    def quantile(self, q: float) -> float:
+        if not 0 <= q <= 1:
+            raise ValueError("Quantile must be between 0 and 1.")
+        weighted = sorted((value, 1 << height)
+                          for height, items in enumerate(self._compactors) for value in items)
+        if not weighted:
+            return math.nan
+        target = q * self.count
+        cumulative = 0
+        for value, weight in weighted:
+            cumulative += weight
+            if cumulative >= target:
+                return value
+        return weighted[-1][0] # pragma: no cover
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"k": self.k, "count": self.count, "compactors": [list(items) for items in self._compactors]}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], seed: Optional[int] = None) -> 'KLLSketch':
+        sketch = cls(data["k"], seed)
+        sketch._compactors = [list(items) for items in data["compactors"]]
+        sketch.count = data["count"]
+        sketch._size = sum(len(items) for items in sketch._compactors)
+        sketch._max_size = sum(sketch._capacity(height) for height in range(len(sketch._compactors)))
+        return sketch
+
+    def _capacity(self, height: int) -> int:
+        depth = len(self._compactors) - height - 1
+        return int(math.ceil((2 / 3) ** depth * self.k)) + 1
+
+    def _grow(self) -> None:
+        self._compactors.append([])
+        self._max_size = sum(self._capacity(height) for height in range(len(self._compactors)))
+
+    def _compress(self) -> None:
+        # While the sketch is full at least one compactor is at capacity.
+        height = next(height for height, items in enumerate(self._compactors)
+                      if len(items) >= self._capacity(height))
+        if height + 1 == len(self._compactors):
+            self._grow()
+        items = self._compactors[height]
+        items.sort()
+        if self._random is None:
+            import random
+            self._random = random.Random(self._seed)
+        leftover = len(items) % 2
+        offset = leftover + self._random.randrange(2)
+        self._compactors[height + 1].extend(items[offset::2])
+        del items[leftover:]
+        self._size = sum(len(items) for items in self._compactors)
+
+class StreamingStatistics:
+    """
+    Running statistics over calculation results: count, mean, variance, exact
+    min and max, and approximate quantiles from a KLLSketch. Vector results
+    contribute every element. Nothing is stored per result, and statistics
+    from other sessions or processes can be merged in via to_dict/from_dict.
+    Infinite and nan results are only counted, since a single one would turn
+    the mean and variance into nan for the rest of the stream.
+    """
+    def __init__(self, k: int = 200, seed: Optional[int] = None) -> None:
+        self.stats: RunningStats = RunningStats()
+        self.sketch: KLLSketch = KLLSketch(k, seed)
+        self.nonfinite: int = 0
+
+    def __len__(self) -> int:
+        return self.stats.count + self.nonfinite
+
+    def update(self, result: Operand) -> None:
+        if is_vector(result):
+            for item in result:
+                self.update(item)
+            return
+        if not math.isfinite(result):
+            self.nonfinite += 1
+            return
+        self.stats.update(result)
+        self.sketch.update(result)
+
+    def merge(self, other: 'StreamingStatistics') -> None:
+        self.stats.merge(other.stats)
+        self.sketch.merge(other.sketch)
+        self.nonfinite += other.nonfinite
+
+    def quantile(self, q: float) -> float:
+        return self.sketch.quantile(q)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"stats": self.stats.to_dict(), "sketch": self.sketch.to_dict(), "nonfinite": self.nonfinite}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], seed: Optional[int] = None) -> 'StreamingStatistics':
+        statistics = cls(data["sketch"]["k"], seed)
+        statistics.stats = RunningStats.from_dict(data["stats"])
+        statistics.sketch = KLLSketch.from_dict(data["sketch"], seed)
+        statistics.nonfinite = data["nonfinite"]
+        return statistics
+
+    def summary(self) -> str:
+        stats = self.stats
+        return "\n".join([
+            f"count    : {stats.count}",
+            f"mean     : {stats.mean}",
+            f"variance : {stats.variance}",
+            f"stdev    : {stats.stdev}",
+            f"min      : {stats.min}",
+            f"max      : {stats.max}",
+            f"p50      : {self.quantile(0.5)}",
+            f"p90      : {self.quantile(0.9)}",
+            f"p99      : {self.quantile(0.99)}",
+            f"inf/nan  : {self.nonfinite}",
+        ])
@@ -0,0 +1,81 @@
+"""
+Cold-start benchmark for the calculator.
+
+Starts `python main.py` repeatedly and measures how long it takes until the
+first prompt is printed, and until the first result is printed when the
+input is piped in as a batch. Run it from anywhere:
+
+    python benchmarks/startup.py --runs 20
+    python benchmarks/startup.py --max-prompt-ms 80 --max-result-ms 100
+
+With the --max-* options the script exits with status 1 when the median time
+is above the limit, so it can guard against startup regressions in CI.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def _read_until(process: subprocess.Popen, marker: bytes) -> None:
+    output = b""
+    while marker not in output:
+        chunk = os.read(process.stdout.fileno(), 4096)
+        if not chunk:
+            raise RuntimeError(f"Calculator exited before printing {marker!r}.")
+        output += chunk
+
+def _start() -> subprocess.Popen:
+    return subprocess.Popen([sys.executable, "-u", "main.py"], cwd=ROOT,
+                            stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+
+def time_to_prompt() -> float:
+    started = time.perf_counter()
+    process = _start()
+    _read_until(process, b">> ")
+    elapsed = time.perf_counter() - started
+    process.communicate(b"exit\n")
+    return elapsed
+
+def time_to_batch_result() -> float:
+    started = time.perf_counter()
+    process = _start()
+    process.stdin.write(b"add 1 2\nexit\n")
+    process.stdin.flush()
+    _read_until(process, b"Result:")
+    elapsed = time.perf_counter() - started
+    process.communicate()
+    return elapsed
+
+def run(runs: int) -> Dict[str, List[float]]:
+    timings: Dict[str, List[float]] = {"first prompt": [], "first batch result": []}
+    for _ in range(runs):
+        timings["first prompt"].append(time_to_prompt() * 1000)
+        timings["first batch result"].append(time_to_batch_result() * 1000)
+    return timings
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure calculator cold-start time.")
+    parser.add_argument("--runs", type=int, default=10, help="number of cold starts to measure")
+    parser.add_argument("--max-prompt-ms", type=float, help="fail if the median time to the first prompt is higher")
+    parser.add_argument("--max-result-ms", type=float, help="fail if the median time to the first result is higher")
+    args = parser.parse_args()
+
+    timings = run(args.runs)
+    for name, values in timings.items():
+        print(f"{name:>20}: median {statistics.median(values):7.2f} ms, "
+              f"min {min(values):7.2f} ms, max {max(values):7.2f} ms")
+
+    limits = {"first prompt": args.max_prompt_ms, "first batch result": args.max_result_ms}
+    failed = [name for name, limit in limits.items()
+              if limit is not None and statistics.median(timings[name]) > limit]
+    for name in failed:
+        print(f"Startup regression: median time to {name} is above {limits[name]} ms.")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,13 +1,14 @@
 import pytest
 from unittest.mock import patch
-from app.operation import Operation
+from app.operation import Failure, Operation
 from app.calculation import (
     CalculationFactory,
     AddCalculation,
     SubtractCalculation,
     MultiplyCalculation,
     DivideCalculation,
-    Calculation
+    Calculation,
+    CANNOT_DIVIDE_BY_ZERO
 )
 
 # Postive and Negative Tests for Execute Method
@@ -118,6 +119,14 @@ def test_divide_calculation_execute_division_by_zero():
 
     assert str(exc_info.value) == "Cannot divide by zero."
 
+def test_divide_calculation_execute_vector_division_by_zero():
+    divide_calc = DivideCalculation([1.0, 2.0], [0.0, 1.0])
+
+    with pytest.raises(ZeroDivisionError) as exc_info:
+        divide_calc.execute()
+
+    assert str(exc_info.value) == "Cannot divide by zero."
+
 def test_factory_creates_add_calculation():
     a = 4.0
     b = 3.0
@@ -289,3 +298,57 @@ def test_calculation_str_parameterized(
     calc = CalculationFactory.create_calculation(calc_type, a, b)
     calc_str = str(calc)
     assert calc_str == expected_str
+
+
+# Tests for the non-raising API
+
+def test_calculation_try_execute_positive():
+    assert AddCalculation(2.0, 3.0).try_execute() == 5.0
+    assert DivideCalculation(9.0, 3.0).try_execute() == 3.0
+
+def test_divide_calculation_try_execute_division_by_zero():
+    result = DivideCalculation(10.0, 0.0).try_execute()
+
+    assert result is CANNOT_DIVIDE_BY_ZERO
+    assert str(result) == "Cannot divide by zero."
+    assert DivideCalculation([1.0, 2.0], [1.0, 0.0]).try_execute() is CANNOT_DIVIDE_BY_ZERO
+
+@patch.object(Operation, 'addition')
+def test_calculation_try_execute_negative(mock_addition):
+    mock_addition.side_effect = Exception("Addition error")
+    result = AddCalculation(1.0, 2.0).try_execute()
+
+    assert isinstance(result, Failure)
+    assert str(result) == "Addition error"
+
+def test_factory_evaluate_batch():
+    rows = [
+        ('add', 1.0, 2.0),
+        ('DIVIDE', 1.0, 0.0),
+        ('modulus', 4.0, 2.0),
+        ('multiply', 3.0, 4.0),
+        ('modulus', 5.0, 2.0),
+    ]
+    results = CalculationFactory.evaluate_batch(rows)
+
+    assert results[0] == 3.0
+    assert results[1] is CANNOT_DIVIDE_BY_ZERO
+    assert isinstance(results[2], Failure)
+    assert "Unsupported calculation type: 'modulus'" in str(results[2])
+    assert results[3] == 12.0
+    assert results[4] is results[2]
+
+def test_factory_evaluate_batch_bad_operands():
+    rows = [
+        ('divide', 1.0, 'x'),
+        ('add', 1.0, 'x'),
+        ('divide', [1.0, 2.0], 2.0),
+        ('divide', [1.0, 2.0], [1.0, 2.0, 3.0]),
+    ]
+    results = CalculationFactory.evaluate_batch(rows)
+
+    assert isinstance(results[0], Failure)
+    assert "unsupported operand type(s) for /" in str(results[0])
+    assert isinstance(results[1], Failure)
+    assert results[2] == [0.5, 1.0]
+    assert str(results[3]) == "Operands could not be broadcast together with shapes (2,) and (3,)."
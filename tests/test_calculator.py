@@ -1,7 +1,11 @@
+import subprocess
+import sys
 import pytest
 from io import StringIO
+from pathlib import Path
 
-from app.calculator import display_help, display_history, calculator
+from app.calculator import COMMANDS, display_help, display_history, calculator, parse_operand
+from app.profiling import Profiler
 
 def test_display_help(capsys):
     display_help()
@@ -13,6 +17,8 @@ Calculator REPL Help
 Usage:
     <operation> <number1> <number2>
     - Perform a calculation with the specified operation and two numbers.
+    - Either number can be a vector [1,2,3] or a 2-D array [[1,2],[3,4]];
+      scalars and vectors are broadcast against each other.
     - Supported operations:
         add       : Adds two numbers.
         subtract  : Subtracts the second number from the first.
@@ -22,6 +28,15 @@ Usage:
 Special Commands:
     help      : Display this help message.
     history   : Show the history of calculations.
+    stats     : Show running statistics of all results (mean, variance, quantiles).
+    undo      : Remove the last calculation from the history.
+    redo      : Restore the last undone calculation.
+    checkpoint [name] : Save the current history under a name.
+    rollback [name]   : Restore the history saved by a checkpoint.
+    profile on [mode] : Start profiling (modes: spans, cprofile, sampling).
+    profile off       : Stop profiling.
+    profile export <file> : Save the profile (.json Chrome trace, .prof pstats,
+                            otherwise collapsed stacks).
     exit      : Exit the calculator.
 
 Examples:
@@ -29,6 +44,8 @@ Examples:
     subtract 15.5 3.2
     multiply 7 8
     divide 20 4
+    add [1,2,3] 5
+    multiply [[1,2],[3,4]] [10,20]
 """
     assert captured.out.strip() == expected_output.strip()
 
@@ -141,6 +158,17 @@ def test_calculation_division_by_zero(monkeypatch, capsys):
     captured = capsys.readouterr()
     assert "Cannot divide by zero." in captured.out
 
+def test_calculation_vector_division_by_zero(monkeypatch, capsys):
+    user_input = 'divide [1,2] [0,1]\ndivide [[1,2],[3,4]] [[1,2],[0,4]]\nexit\n'
+    monkeypatch.setattr('sys.stdin', StringIO(user_input))
+
+    with pytest.raises(SystemExit):
+        calculator()
+
+    captured = capsys.readouterr()
+    assert captured.out.count("Cannot divide by zero.") == 2
+    assert "An error occurred during calculation" not in captured.out
+
 def test_calculator_history(monkeypatch, capsys):
     user_input = 'add 5 4\nsubtract 10 3\nhistory\nexit\n'
     monkeypatch.setattr('sys.stdin', StringIO(user_input))
@@ -221,4 +249,188 @@ def test_calculator_unexpected_exception(monkeypatch, capsys):
 
     captured = capsys.readouterr()
     assert "An error occurred during calculation: Mock exception during execution" in captured.out
-    assert "Please try again." in captured.out
\ No newline at end of file
+    assert "Please try again." in captured.out
+
+def test_calculator_undo_redo(monkeypatch, capsys):
+    user_input = 'add 1 2\nundo\nundo\nhistory\nredo\nredo\nhistory\nexit\n'
+    monkeypatch.setattr('sys.stdin', StringIO(user_input))
+
+    with pytest.raises(SystemExit):
+        calculator()
+
+    captured = capsys.readouterr()
+    assert "Undid: AddCalculation: 1.0 Add 2.0 = 3.0" in captured.out
+    assert "Nothing to undo." in captured.out
+    assert "No calculations performed yet." in captured.out
+    assert "Redid: AddCalculation: 1.0 Add 2.0 = 3.0" in captured.out
+    assert "Nothing to redo." in captured.out
+    assert "1. AddCalculation: 1.0 Add 2.0 = 3.0" in captured.out
+
+def test_calculator_checkpoint_rollback(monkeypatch, capsys):
+    user_input = 'add 1 2\ncheckpoint before\nmultiply 3 4\ncheckpoint\nrollback before\nhistory\nexit\n'
+    monkeypatch.setattr('sys.stdin', StringIO(user_input))
+
+    with pytest.raises(SystemExit):
+        calculator()
+
+    captured = capsys.readouterr()
+    assert "Saved checkpoint 'before'." in captured.out
+    assert "Saved checkpoint '2'." in captured.out
+    assert "Rolled back to checkpoint 'before'." in captured.out
+    assert "1. AddCalculation: 1.0 Add 2.0 = 3.0" in captured.out
+    assert "2. MultiplyCalculation" not in captured.out
+
+def test_calculator_rollback_errors(monkeypatch, capsys):
+    user_input = 'rollback\ncheckpoint a b\nrollback missing\nexit\n'
+    monkeypatch.setattr('sys.stdin', StringIO(user_input))
+
+    with pytest.raises(SystemExit):
+        calculator()
+
+    captured = capsys.readouterr()
+    assert "No checkpoints have been saved." in captured.out
+    assert "Usage: checkpoint [name]" in captured.out
+    assert "Unknown checkpoint: 'missing'." in captured.out
+
+
+def test_calculator_profile_session(monkeypatch, capsys, tmp_path):
+    trace_path = tmp_path / "trace.json"
+    user_input = f'profile on\nadd 1 2\nhistory\nprofile off\nprofile export {trace_path}\nexit\n'
+    monkeypatch.setattr('sys.stdin', StringIO(user_input))
+    profiler = Profiler()
+
+    with pytest.raises(SystemExit):
+        calculator(profiler)
+
+    captured = capsys.readouterr()
+    assert "Profiling on (spans)." in captured.out
+    assert "Profiling off." in captured.out
+    assert f"Profile exported to {trace_path}." in captured.out
+    assert set(profiler.collapsed_stacks()) == {"parse", "dispatch", "execute", "format", "history"}
+    assert trace_path.exists()
+
+def test_calculator_profile_command_case(monkeypatch, capsys, tmp_path):
+    trace_path = tmp_path / "Trace.JSON.txt"
+    user_input = f'PROFILE ON Spans\nadd 1 2\nProfile Off\nprofile EXPORT {trace_path}\nexit\n'
+    monkeypatch.setattr('sys.stdin', StringIO(user_input))
+
+    with pytest.raises(SystemExit):
+        calculator()
+
+    captured = capsys.readouterr()
+    assert "Profiling on (spans)." in captured.out
+    assert "Profiling off." in captured.out
+    assert f"Profile exported to {trace_path}." in captured.out
+    assert trace_path.exists()
+
+def test_calculator_profile_errors(monkeypatch, capsys, tmp_path):
+    user_input = (f'profile\nprofile on bogus\nprofile on\nprofile on\n'
+                  f'profile export {tmp_path / "out.prof"}\nexit\n')
+    monkeypatch.setattr('sys.stdin', StringIO(user_input))
+
+    with pytest.raises(SystemExit):
+        calculator()
+
+    captured = capsys.readouterr()
+    assert "Usage: profile on [mode] | profile off | profile export <file>" in captured.out
+    assert "Unsupported profiling mode: 'bogus'." in captured.out
+    assert "Profiling is already on." in captured.out
+    assert "No cProfile data." in captured.out
+
+
+@pytest.mark.parametrize("token, expected", [
+    ("5", 5.0),
+    ("[1,2,3]", [1.0, 2.0, 3.0]),
+    ("[1.5, -2]", [1.5, -2.0]),
+    ("[[1,2],[3,4]]", [[1.0, 2.0], [3.0, 4.0]]),
+])
+def test_parse_operand(token, expected):
+    assert parse_operand(token) == expected
+
+@pytest.mark.parametrize("token, message", [
+    ("[1,", "Invalid vector literal: [1,"),
+    ("[]", "Invalid vector literal: []"),
+    ("[1,'a']", "Invalid vector literal: [1,'a']"),
+    ("[True]", "Invalid vector literal: [True]"),
+    ("[[1,2],[3]]", "Arrays must be rectangular: [[1,2],[3]]"),
+    ("[[]]", "Arrays must be rectangular: [[]]"),
+    ("[1,[2]]", "Invalid vector literal: [1,[2]]"),
+])
+def test_parse_operand_invalid(token, message):
+    with pytest.raises(ValueError) as exc_info:
+        parse_operand(token)
+
+    assert message in str(exc_info.value)
+
+def test_calculator_vector_operands(monkeypatch, capsys):
+    user_input = 'add [1,2,3] 5\nmultiply [[1, 2], [3, 4]] [10, 20]\nadd [1,2] [1,2,3]\nadd [1, 2\nexit\n'
+    monkeypatch.setattr('sys.stdin', StringIO(user_input))
+
+    with pytest.raises(SystemExit):
+        calculator()
+
+    captured = capsys.readouterr()
+    assert "Result: AddCalculation: [1.0, 2.0, 3.0] Add 5.0 = [6.0, 7.0, 8.0]" in captured.out
+    assert "= [[10.0, 40.0], [30.0, 80.0]]" in captured.out
+    assert "Operands could not be broadcast together with shapes (2,) and (3,)." in captured.out
+    assert "Invalid input. Please follow the format: <operation> <num1> <num2>" in captured.out
+
+
+def test_calculator_interactive_session_enables_line_editing(monkeypatch, capsys, tmp_path):
+    class TerminalInput(StringIO):
+        def isatty(self):
+            return True
+
+    history_path = tmp_path / "history"
+    monkeypatch.setenv('CALCULATOR_HISTFILE', str(history_path))
+    monkeypatch.setattr('sys.stdin', TerminalInput('exit\n'))
+    saved = []
+    monkeypatch.setattr('app.console.HistoryFile.save_async', lambda self: saved.append(self.path))
+
+    with pytest.raises(SystemExit):
+        calculator()
+
+    assert 'readline' in sys.modules
+    assert saved == [str(history_path)]
+
+def test_commands_match_help(capsys):
+    display_help()
+    help_text = capsys.readouterr().out.split("Special Commands:")[1].split("Examples:")[0]
+    listed = {line.split()[0] for line in help_text.splitlines() if ":" in line}
+
+    assert listed == set(COMMANDS)
+
+def test_calculator_lean_startup():
+    code = ("import sys, main; "
+            "print(sorted(m for m in ('readline', 'ast', 'cProfile', 'random') if m in sys.modules))")
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                            cwd=Path(__file__).parent.parent).stdout
+
+    assert output.strip() == "[]"
+
+def test_calculator_stats(monkeypatch, capsys):
+    user_input = 'stats\nadd 1 1\nmultiply 2 2\nadd [1,2] 0\nstats\nexit\n'
+    monkeypatch.setattr('sys.stdin', StringIO(user_input))
+
+    with pytest.raises(SystemExit):
+        calculator()
+
+    captured = capsys.readouterr()
+    assert "No calculations performed yet." in captured.out
+    assert "Result Statistics:" in captured.out
+    assert "count    : 4" in captured.out
+    assert "mean     : 2.25" in captured.out
+    assert "min      : 1.0" in captured.out
+    assert "max      : 4.0" in captured.out
+
+def test_calculator_stats_non_finite_results(monkeypatch, capsys):
+    user_input = 'add inf 1\nadd 1 1\nsubtract inf inf\nadd 3 1\nstats\nexit\n'
+    monkeypatch.setattr('sys.stdin', StringIO(user_input))
+
+    with pytest.raises(SystemExit):
+        calculator()
+
+    captured = capsys.readouterr()
+    assert "mean     : 3.0" in captured.out
+    assert "variance : 2.0" in captured.out
+    assert "inf/nan  : 2" in captured.out
@@ -0,0 +1,106 @@
+import readline
+import pytest
+from app.calculation import Calculation, CalculationFactory
+from app.console import Completer, HistoryFile, PrefixIndex, setup_readline
+
+@pytest.fixture(autouse=True)
+def clear_readline_history():
+    readline.clear_history()
+    yield
+    readline.clear_history()
+
+def test_prefix_index_complete():
+    index = PrefixIndex(['multiply', 'add', 'divide', 'add', 'mod'])
+
+    assert len(index) == 4
+    assert index.complete('m') == ['mod', 'multiply']
+    assert index.complete('') == ['add', 'divide', 'mod', 'multiply']
+    assert index.complete('x') == []
+
+def test_prefix_index_many_words():
+    index = PrefixIndex(f"op{i:05d}" for i in range(10000))
+
+    assert index.complete('op0999') == [f"op0999{i}" for i in range(10)]
+
+def complete_all(completer, text):
+    matches = []
+    state = 0
+    while (match := completer.complete(text, state)) is not None:
+        matches.append(match)
+        state += 1
+    return matches
+
+def test_completer_operations_and_commands():
+    completer = Completer(line_buffer=lambda: 'd', word_start=lambda: 0)
+
+    assert complete_all(completer, 'd') == ['divide ']
+    assert complete_all(completer, 'H') == ['help ', 'history ']
+    assert complete_all(completer, 'st') == ['stats ']
+
+def test_completer_only_completes_first_word():
+    completer = Completer(line_buffer=lambda: 'add 1 a', word_start=lambda: 6)
+
+    assert complete_all(completer, 'a') == []
+
+def test_completer_follows_registry():
+    completer = Completer(line_buffer=lambda: 'p', word_start=lambda: 0)
+    index = completer.index
+
+    assert complete_all(completer, 'p') == ['profile ']
+    assert completer.index is index
+
+    @CalculationFactory.register_calculation('power')
+    class PowerCalculation(Calculation):
+        def execute(self) -> float:
+            return self.a ** self.b
+
+    assert complete_all(completer, 'p') == ['power ', 'profile ']
+    assert completer.index is not index
+
+def test_history_file_round_trip(tmp_path):
+    path = tmp_path / "history"
+    history = HistoryFile(str(path), length=3)
+
+    assert history.load() == 0
+    for line in ['add 1 2', 'subtract 3 1', 'multiply 2 2', 'divide 8 2']:
+        readline.add_history(line)
+    history.save()
+
+    assert path.read_text().splitlines() == ['subtract 3 1', 'multiply 2 2', 'divide 8 2']
+
+    readline.add_history('add 5 5')
+    history.save_async().join()
+    history.save()
+
+    assert path.read_text().splitlines() == ['multiply 2 2', 'divide 8 2', 'add 5 5']
+
+    readline.clear_history()
+    assert HistoryFile(str(path), length=3).load() == 3
+    assert readline.get_history_item(3) == 'add 5 5'
+
+def test_history_file_save_errors_are_ignored(tmp_path):
+    history = HistoryFile(str(tmp_path / "missing" / "history"))
+    history.load()
+    readline.add_history('add 1 2')
+
+    with pytest.raises(OSError):
+        history.save()
+    history.save_async().join()
+
+def test_history_file_invalid_length():
+    with pytest.raises(ValueError) as exc_info:
+        HistoryFile(length=0)
+
+    assert "History length must be at least 1." in str(exc_info.value)
+
+def test_setup_readline(monkeypatch, tmp_path):
+    path = tmp_path / "history"
+    path.write_text("add 1 2\n")
+    monkeypatch.setenv('CALCULATOR_HISTFILE', str(path))
+
+    history = setup_readline(history_length=50)
+
+    assert history.path == str(path)
+    assert history.length == 50
+    assert readline.get_current_history_length() == 1
+    assert readline.get_completer() is not None
@@ -0,0 +1,102 @@
+import pytest
+from app.calculation import AddCalculation, SubtractCalculation, MultiplyCalculation
+from app.history import History
+
+def test_history_append_and_iterate():
+    history = History()
+    add_calc = AddCalculation(1.0, 2.0)
+    subtract_calc = SubtractCalculation(5.0, 3.0)
+    history.append(add_calc)
+    history.append(subtract_calc)
+
+    assert len(history) == 2
+    assert list(history) == [add_calc, subtract_calc]
+
+def test_history_empty():
+    history = History()
+
+    assert not history
+    assert list(history) == []
+    assert history.undo() is None
+    assert history.redo() is None
+
+def test_history_undo_redo():
+    history = History()
+    add_calc = AddCalculation(1.0, 2.0)
+    subtract_calc = SubtractCalculation(5.0, 3.0)
+    history.append(add_calc)
+    history.append(subtract_calc)
+
+    assert history.undo() is subtract_calc
+    assert history.undo() is add_calc
+    assert len(history) == 0
+    assert history.redo() is add_calc
+    assert history.redo() is subtract_calc
+    assert list(history) == [add_calc, subtract_calc]
+
+def test_history_append_clears_redo():
+    history = History()
+    history.append(AddCalculation(1.0, 2.0))
+    history.undo()
+    history.append(SubtractCalculation(5.0, 3.0))
+
+    assert history.redo() is None
+
+def test_history_checkpoint_shares_entries():
+    history = History()
+    add_calc = AddCalculation(1.0, 2.0)
+    history.append(add_calc)
+    name = history.checkpoint()
+    history.append(SubtractCalculation(5.0, 3.0))
+    history.append(MultiplyCalculation(2.0, 3.0))
+
+    assert name == '1'
+    assert history._checkpoints[name] is history._head.parent.parent
+
+    assert history.rollback() == '1'
+    assert list(history) == [add_calc]
+
+def test_history_checkpoint_names():
+    history = History()
+    history.checkpoint('2')
+
+    assert history.checkpoint() == '3'
+    assert history.checkpoint('a') == 'a'
+    assert history.checkpoints() == ['2', '3', 'a']
+
+def test_history_rollback_to_resaved_checkpoint():
+    history = History()
+    history.checkpoint('a')
+    history.checkpoint('b')
+    history.append(AddCalculation(1.0, 2.0))
+    history.checkpoint('a')
+
+    assert history.checkpoints() == ['b', 'a']
+    assert history.rollback() == 'a'
+    assert len(history) == 1
+
+def test_history_rollback_clears_redo():
+    history = History()
+    history.checkpoint('start')
+    history.append(AddCalculation(1.0, 2.0))
+    history.undo()
+    history.rollback('start')
+
+    assert history.redo() is None
+
+def test_history_rollback_without_checkpoints():
+    history = History()
+
+    with pytest.raises(ValueError) as exc_info:
+        history.rollback()
+
+    assert "No checkpoints have been saved." in str(exc_info.value)
+
+def test_history_rollback_unknown_checkpoint():
+    history = History()
+    history.checkpoint('start')
+
+    with pytest.raises(ValueError) as exc_info:
+        history.rollback('missing')
+
+    assert "Unknown checkpoint: 'missing'. Available checkpoints: start" in str(exc_info.value)
@@ -1,7 +1,8 @@
 """ tests/test_operations.py """
+import operator
 import pytest
 from typing import Union
-from app.operation import Operation
+from app.operation import DIVISION_BY_ZERO, Failure, Operation, contains_zero, elementwise
 
 
 Number = Union[int, float]
@@ -109,4 +110,91 @@ def test_division_by_zero(a: Number, b: Number) -> None:
         Operation.division(a, b)
 
     assert "Division by zero is not allowed." in str(excinfo.value), \
-        f"Expected error message 'Division by zero is not allowed.', but got '{excinfo.value}'"
\ No newline at end of file
+        f"Expected error message 'Division by zero is not allowed.', but got '{excinfo.value}'"
+
+@pytest.mark.parametrize(
+    "a, b, expected",
+    [
+        (15, 3, 5),
+        (-8.0, 2.0, -4.0),
+    ],
+    ids=[
+        "try_divide_two_positive_integers",
+        "try_divide_negative_float_by_positive_float"
+    ]
+)
+def test_try_division(a: Number, b: Number, expected: float) -> None:
+    result = Operation.try_division(a, b)
+    assert result == expected, f"Expected try_division({a}, {b}) to be {expected}, but got {result}"
+
+def test_try_division_by_zero() -> None:
+    result = Operation.try_division(1, 0)
+
+    assert result is DIVISION_BY_ZERO
+    assert isinstance(result, Failure)
+    assert str(result) == "Division by zero is not allowed."
+    assert repr(result) == "Failure('Division by zero is not allowed.')"
+
+@pytest.mark.parametrize(
+    "method, a, b, expected",
+    [
+        (Operation.addition, [1, 2, 3], 5, [6, 7, 8]),
+        (Operation.addition, 5, (1, 2, 3), [6, 7, 8]),
+        (Operation.subtraction, [5.0, 6.0], [1.0, 2.0], [4.0, 4.0]),
+        (Operation.multiplication, [[1, 2], [3, 4]], [10, 20], [[10, 40], [30, 80]]),
+        (Operation.multiplication, 2, [[1, 2], [3, 4]], [[2, 4], [6, 8]]),
+        (Operation.division, [[2, 4], [6, 8]], [[2], [4]], [[1.0, 2.0], [1.5, 2.0]]),
+        (Operation.addition, [1], [1, 2, 3], [2, 3, 4]),
+        (Operation.addition, [[1, 2]], [[1, 1], [2, 2]], [[2, 3], [3, 4]]),
+        (Operation.try_division, [2.0, 4.0], 2.0, [1.0, 2.0]),
+    ],
+    ids=[
+        "add_vector_and_scalar",
+        "add_scalar_and_tuple",
+        "subtract_two_vectors",
+        "multiply_matrix_by_vector",
+        "multiply_scalar_by_matrix",
+        "divide_matrix_by_column",
+        "add_stretched_vector",
+        "add_stretched_matrix_row",
+        "try_divide_vector_by_scalar",
+    ]
+)
+def test_vector_operations(method, a, b, expected) -> None:
+    result = method(a, b)
+    assert result == expected, f"Expected {method.__name__}({a}, {b}) to be {expected}, but got {result}"
+
+def test_vector_operations_shape_mismatch() -> None:
+    with pytest.raises(ValueError, match=r"Operands could not be broadcast together with shapes \(2, 2\) and \(3,\)."):
+        Operation.addition([[1, 2], [3, 4]], [1, 2, 3])
+
+    with pytest.raises(ValueError, match=r"shapes \(0,\) and \(2,\)."):
+        Operation.subtraction([], [1, 2])
+
+def test_vector_division_by_zero() -> None:
+    with pytest.raises(ValueError, match="Division by zero is not allowed."):
+        Operation.division([1, 2], [1, 0])
+
+    assert Operation.try_division([1, 2], [1, 0]) is DIVISION_BY_ZERO
+
+def test_try_division_shape_mismatch() -> None:
+    result = Operation.try_division([1, 2], [1, 2, 3])
+
+    assert isinstance(result, Failure)
+    assert str(result) == "Operands could not be broadcast together with shapes (2,) and (3,)."
+
+@pytest.mark.parametrize("value, expected", [
+    (0.0, True),
+    (2.0, False),
+    ([1.0, 0.0], True),
+    ([1.0, 2.0], False),
+    ([[1.0, 2.0], [0.0, 4.0]], True),
+    ([[1.0, 2.0], [3.0, 4.0]], False),
+    ([], False),
+])
+def test_contains_zero(value, expected) -> None:
+    assert contains_zero(value) is expected
+
+def test_elementwise_empty_operands() -> None:
+    assert elementwise(operator.add, [], 1) == []
+    assert elementwise(operator.add, [[]], [[]]) == [[]]
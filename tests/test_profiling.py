@@ -0,0 +1,137 @@
+import json
+import sys
+import threading
+import time
+import pytest
+from app.profiling import Profiler
+
+def test_profiler_span_disabled():
+    profiler = Profiler()
+
+    with profiler.span("parse"):
+        pass
+
+    assert not profiler.enabled
+    assert profiler.span("parse") is profiler.span("execute")
+    assert profiler.collapsed_stacks() == {}
+
+def test_profiler_nested_spans():
+    profiler = Profiler()
+    profiler.start()
+    with profiler.span("line"):
+        with profiler.span("parse"):
+            time.sleep(0.002)
+        with profiler.span("execute"):
+            pass
+    profiler.stop()
+
+    stacks = profiler.collapsed_stacks()
+    assert set(stacks) == {"line", "line;parse", "line;execute"}
+    assert stacks["line;parse"] >= 2000
+    assert stacks["line"] >= 0
+
+def test_profiler_chrome_trace_export(tmp_path):
+    profiler = Profiler()
+    profiler.start('spans')
+    with profiler.span("execute"):
+        pass
+    profiler.stop()
+    path = tmp_path / "trace.json"
+    profiler.export(str(path))
+
+    trace = json.loads(path.read_text())
+    assert [event["name"] for event in trace["traceEvents"]] == ["execute"]
+    assert trace["traceEvents"][0]["ph"] == "X"
+    assert trace["traceEvents"][0]["dur"] >= 0
+
+def test_profiler_collapsed_export(tmp_path):
+    profiler = Profiler()
+    profiler.start()
+    with profiler.span("format"):
+        pass
+    profiler.stop()
+    path = tmp_path / "stacks.txt"
+    profiler.export(str(path))
+
+    assert path.read_text().startswith("format ")
+
+def test_profiler_cprofile_export(tmp_path):
+    profiler = Profiler()
+    profiler.start('cprofile')
+    sum(range(100))
+    profiler.stop()
+    path = tmp_path / "session.prof"
+    profiler.export(str(path))
+
+    assert path.stat().st_size > 0
+
+def _profiled_function():
+    return sum(range(100))
+
+def test_profiler_cprofile_export_while_running(tmp_path):
+    import pstats
+    profiler = Profiler()
+    profiler.start('cprofile')
+    first = tmp_path / "first.prof"
+    profiler.export(str(first))
+    _profiled_function()
+    second = tmp_path / "second.prof"
+    profiler.export(str(second))
+    profiler.stop()
+
+    assert profiler.mode is None
+    functions = {name for _, _, name in pstats.Stats(str(first)).stats}
+    assert "_profiled_function" not in functions
+    functions = {name for _, _, name in pstats.Stats(str(second)).stats}
+    assert "_profiled_function" in functions
+
+def test_profiler_cprofile_export_keeps_profiling(tmp_path):
+    profiler = Profiler()
+    profiler.start('cprofile')
+    try:
+        profiler.export(str(tmp_path / "session.prof"))
+        assert profiler.mode == 'cprofile'
+        assert sys.getprofile() is not None
+    finally:
+        profiler.stop()
+
+def test_profiler_pstats_without_data(tmp_path):
+    profiler = Profiler()
+
+    with pytest.raises(ValueError) as exc_info:
+        profiler.export_pstats(str(tmp_path / "session.prof"))
+
+    assert "No cProfile data." in str(exc_info.value)
+
+def test_profiler_sampling():
+    profiler = Profiler(interval=0.0005)
+    profiler.start('sampling')
+    deadline = time.perf_counter() + 0.05
+    while time.perf_counter() < deadline:
+        pass
+    profiler.stop()
+
+    stacks = profiler.collapsed_stacks()
+    assert stacks
+    assert any("test_profiling.py:test_profiler_sampling" in stack for stack in stacks)
+
+def test_profiler_sampling_unknown_thread():
+    profiler = Profiler(interval=0.0005)
+    profiler._stop_sampling = threading.Event()
+    timer = threading.Timer(0.01, profiler._stop_sampling.set)
+    timer.start()
+    profiler._sample(-1)
+
+    assert profiler.collapsed_stacks() == {}
+
+def test_profiler_start_errors():
+    profiler = Profiler()
+
+    with pytest.raises(ValueError) as exc_info:
+        profiler.start('bogus')
+    assert "Unsupported profiling mode: 'bogus'. Available modes: spans, cprofile, sampling" in str(exc_info.value)
+
+    profiler.start()
+    with pytest.raises(ValueError) as exc_info:
+        profiler.start()
+    assert "Profiling is already on." in str(exc_info.value)
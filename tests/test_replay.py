@@ -0,0 +1,146 @@
+import io
+import runpy
+import sys
+import pytest
+from app.calculation import AddCalculation, Calculation, CalculationFactory, DivideCalculation
+from app.calculator import display_history
+from app.replay import Mismatch, ReplayReport, main, parse_record, replay
+
+CLASS_NAMES = {'AddCalculation': 'add', 'DivideCalculation': 'divide'}
+
+@pytest.mark.parametrize("line, expected", [
+    ("add 1 2 3", ('add', 1.0, 2.0, 3.0)),
+    ("multiply 2 3 = 6", ('multiply', 2.0, 3.0, 6.0)),
+    ("divide 1 0 error", ('divide', 1.0, 0.0, None)),
+    ("add [1, 2] 1 [2, 3]", ('add', [1.0, 2.0], 1.0, [2.0, 3.0])),
+    ("1. AddCalculation: 5.0 Add 4.0 = 9.0", ('add', 5.0, 4.0, 9.0)),
+    ("DivideCalculation: 8.0 Divide 2.0 = 4.0", ('divide', 8.0, 2.0, 4.0)),
+    ("PowerCalculation: 2.0 Power 3.0 = 8.0", ('power', 2.0, 3.0, 8.0)),
+])
+def test_parse_record(line, expected):
+    assert parse_record(line, CLASS_NAMES) == expected
+
+@pytest.mark.parametrize("line, message", [
+    ("add 1 2", "Expected '<operation> <a> <b> <expected>'"),
+    ("AddCalculation: 5.0 Add 4.0 9.0", "Expected '<Name>Calculation: <a> <Name> <b> = <result>'"),
+    ("add one 2 3", "could not convert string to float"),
+])
+def test_parse_record_invalid(line, message):
+    with pytest.raises(ValueError) as exc_info:
+        parse_record(line, CLASS_NAMES)
+
+    assert message in str(exc_info.value)
+
+def test_replay_matches():
+    lines = [
+        "# recorded session",
+        "add 1 2 3",
+        "",
+        "divide 1 3 0.3333333333",
+        "divide 1 0 error",
+        "subtract nan 1 nan",
+        "multiply [1, 2] [[1], [2]] [[1, 2], [2, 4]]",
+        "1. AddCalculation: 5.0 Add 4.0 = 9.0",
+        "divide [1,2] [1,2,3] error",
+        "add [1,2] [1,2,3] error",
+    ]
+    report = replay(lines, rel_tol=1e-6, workers=0, chunk_size=2)
+
+    assert report.ok
+    assert report.total == 8
+    assert report.matched == 8
+    assert report.throughput > 0
+
+def test_replay_history_output(capsys):
+    display_history([AddCalculation(5.0, 4.0), DivideCalculation(1.0, 4.0)])
+    display_history([])
+    report = replay(io.StringIO(capsys.readouterr().out), workers=0)
+
+    assert report.ok
+    assert report.total == 2
+    assert report.matched == 2
+
+def test_replay_mismatches():
+    lines = [
+        "add 1 2 4",
+        "divide 1 0 1",
+        "add 1 2 error",
+        "add [1, 2] 1 [2, 3, 4]",
+        "add [1, 2] 1 5",
+        "add 1 2 [3]",
+        "subtract 1 1 nan",
+        "modulus 4 2 0",
+        "bogus line",
+    ]
+    report = replay(lines, workers=0, max_mismatches=3)
+
+    assert not report.ok
+    assert report.mismatched == 8
+    assert report.invalid == 1
+    assert [str(mismatch) for mismatch in report.mismatches] == [
+        "line 1: add 1 2 4 -> expected 4.0, got 3.0",
+        "line 2: divide 1 0 1 -> expected 1.0, got error: Cannot divide by zero.",
+        "line 3: add 1 2 error -> expected error, got 3.0",
+    ]
+    assert report.summary().endswith("... and 6 more")
+
+def test_replay_tolerance():
+    assert not replay(["divide 1 3 0.3333"], workers=0).ok
+    assert replay(["divide 1 3 0.3333"], abs_tol=1e-3, workers=0).ok
+
+def test_replay_worker_processes():
+    lines = (f"add {i} {i} {2 * i}" for i in range(1000))
+    report = replay(lines, workers=2, chunk_size=50)
+
+    assert report.ok
+    assert report.matched == 1000
+
+def test_replay_custom_calculation():
+    @CalculationFactory.register_calculation('power')
+    class PowerCalculation(Calculation):
+        def execute(self) -> float:
+            return self.a ** self.b
+
+    report = replay(["PowerCalculation: 2.0 Power 3.0 = 8.0"], workers=0)
+
+    assert report.ok
+
+def test_replay_invalid_chunk_size():
+    with pytest.raises(ValueError) as exc_info:
+        replay([], chunk_size=0)
+
+    assert "Chunk size must be at least 1." in str(exc_info.value)
+
+def test_replay_report_empty():
+    report = ReplayReport()
+
+    assert report.throughput == 0.0
+    assert report.summary() == ("Replayed 0 records in 0.000s (0 records/s)\n"
+                                "Matched: 0, mismatched: 0, invalid: 0")
+
+def test_mismatch_str():
+    assert str(Mismatch(3, "add 1 2 4", "expected 4.0, got 3.0")) == "line 3: add 1 2 4 -> expected 4.0, got 3.0"
+
+def test_replay_main_file(tmp_path, capsys):
+    path = tmp_path / "recorded.log"
+    path.write_text("add 1 2 3\nmultiply 2 3 7\n")
+
+    assert main([str(path), "--workers", "0"]) == 1
+
+    captured = capsys.readouterr()
+    assert "Matched: 1, mismatched: 1, invalid: 0" in captured.out
+    assert "line 2: multiply 2 3 7 -> expected 7.0, got 6.0" in captured.out
+
+def test_replay_main_stdin(monkeypatch, capsys):
+    monkeypatch.setattr('sys.stdin', io.StringIO("add 1 2 3\n"))
+
+    assert main(["-", "--workers", "0"]) == 0
+
+def test_replay_module_entry_point(monkeypatch, capsys):
+    monkeypatch.setattr('sys.stdin', io.StringIO("add 1 2 3\n"))
+    monkeypatch.setattr(sys, 'argv', ["python -m app.replay", "-", "--workers", "0"])
+
+    with pytest.raises(SystemExit) as exc_info:
+        runpy.run_module('app.replay', run_name='__main__')
+
+    assert exc_info.value.code == 0
@@ -0,0 +1,125 @@
+import time
+import pytest
+from concurrent.futures import CancelledError
+from app.scheduler import JobScheduler
+
+def test_scheduler_runs_jobs():
+    with JobScheduler(workers=2) as scheduler:
+        futures = [scheduler.submit('add', i, 1.0) for i in range(10)]
+        results = [future.result(timeout=5) for future in futures]
+
+    assert results == [i + 1.0 for i in range(10)]
+    stats = scheduler.stats()
+    assert stats.completed == 10
+    assert stats.queue_depth == 0
+    assert stats.mean_run >= 0.0
+    assert stats.max_wait >= stats.mean_wait
+
+def test_scheduler_dispatch_order():
+    scheduler = JobScheduler(workers=1, autostart=False)
+    order = []
+    low = scheduler.submit('add', 1.0, 1.0, priority=0)
+    late = scheduler.submit('add', 2.0, 2.0, priority=5, deadline=60.0)
+    early = scheduler.submit('add', 3.0, 3.0, priority=5, deadline=30.0)
+    no_deadline = scheduler.submit('add', 4.0, 4.0, priority=5)
+    for name, future in [('low', low), ('late', late), ('early', early), ('no_deadline', no_deadline)]:
+        future.add_done_callback(lambda _, name=name: order.append(name))
+    scheduler.start()
+    scheduler.start()
+    scheduler.shutdown()
+
+    assert order == ['early', 'late', 'no_deadline', 'low']
+
+def test_scheduler_cancel_job():
+    scheduler = JobScheduler(workers=1, autostart=False)
+    future = scheduler.submit('multiply', 2.0, 3.0)
+
+    assert future.cancel()
+    stats = scheduler.stats()
+    assert stats.cancelled == 1
+    assert stats.queue_depth == 0
+    scheduler.start()
+    scheduler.shutdown()
+
+    with pytest.raises(CancelledError):
+        future.result()
+    stats = scheduler.stats()
+    assert stats.cancelled == 1
+    assert stats.queue_depth == 0
+
+def test_scheduler_cancel_after_dequeue():
+    scheduler = JobScheduler(workers=1, autostart=False)
+    future = scheduler.submit('multiply', 2.0, 3.0)
+    # Take the job off the queue the way a worker does, then cancel it before it runs.
+    job = scheduler._queue.pop()[-1]
+    job.queued = False
+
+    assert future.cancel()
+    scheduler._run(job)
+
+    stats = scheduler.stats()
+    assert stats.cancelled == 1
+    assert stats.queue_depth == 0
+    assert stats.completed == 0
+
+def test_scheduler_shutdown_cancels_pending():
+    scheduler = JobScheduler(workers=1, autostart=False)
+    futures = [scheduler.submit('add', 1.0, 1.0) for _ in range(3)]
+    scheduler.shutdown(wait=False, cancel_pending=True)
+
+    assert all(future.cancelled() for future in futures)
+    stats = scheduler.stats()
+    assert stats.queue_depth == 0
+    assert stats.cancelled == 3
+
+def test_scheduler_expired_deadline():
+    scheduler = JobScheduler(workers=1, autostart=False)
+    future = scheduler.submit('add', 1.0, 1.0, deadline=0.0)
+    time.sleep(0.001)
+    scheduler.start()
+    scheduler.shutdown()
+
+    with pytest.raises(TimeoutError) as exc_info:
+        future.result()
+    assert "Job missed its deadline before it could run." in str(exc_info.value)
+    stats = scheduler.stats()
+    assert stats.expired == 1
+    assert stats.mean_run == 0.0
+
+def test_scheduler_failed_job():
+    with JobScheduler(workers=1) as scheduler:
+        future = scheduler.submit('divide', 1.0, 0.0)
+
+        with pytest.raises(ZeroDivisionError):
+            future.result(timeout=5)
+
+    assert scheduler.stats().failed == 1
+
+def test_scheduler_unsupported_calculation():
+    with JobScheduler(workers=1) as scheduler:
+        with pytest.raises(ValueError) as exc_info:
+            scheduler.submit('modulus', 4.0, 2.0)
+
+    assert "Unsupported calculation type: 'modulus'" in str(exc_info.value)
+
+def test_scheduler_submit_after_shutdown():
+    scheduler = JobScheduler(workers=1)
+    scheduler.shutdown()
+
+    with pytest.raises(RuntimeError) as exc_info:
+        scheduler.submit('add', 1.0, 2.0)
+
+    assert "Cannot submit jobs after shutdown." in str(exc_info.value)
+
+def test_scheduler_requires_worker():
+    with pytest.raises(ValueError) as exc_info:
+        JobScheduler(workers=0)
+
+    assert "The scheduler needs at least one worker." in str(exc_info.value)
+
+def test_scheduler_stats_str():
+    scheduler = JobScheduler(workers=3, autostart=False)
+    stats_str = str(scheduler.stats())
+
+    assert "queue depth: 0, workers: 3" in stats_str
+    assert "wait mean/max: 0.000000/0.000000s" in stats_str
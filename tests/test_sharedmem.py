@@ -0,0 +1,80 @@
+import pytest
+from app.sharedmem import SharedArray, compute_shared, _compute_slice
+
+def test_shared_array_from_values():
+    with SharedArray.from_values([1.0, 2.0, 3.0]) as shared:
+        assert len(shared) == 3
+        assert shared.tolist() == [1.0, 2.0, 3.0]
+
+        attached = SharedArray(3, shared.name)
+        attached.values[0] = 9.0
+        attached.close()
+
+        assert shared.tolist() == [9.0, 2.0, 3.0]
+
+def test_shared_array_empty():
+    with SharedArray(0) as shared:
+        assert shared.tolist() == []
+
+def test_shared_array_negative_length():
+    with pytest.raises(ValueError) as exc_info:
+        SharedArray(-1)
+
+    assert "Shared array length cannot be negative." in str(exc_info.value)
+
+@pytest.mark.parametrize("calc_type, b_values, expected", [
+    ('add', [1.0, 1.0, 1.0, 1.0, 1.0], [1.0, 2.0, 3.0, 4.0, 5.0]),
+    ('multiply', [2.0, 2.0, 2.0, 2.0, 2.0], [0.0, 2.0, 4.0, 6.0, 8.0]),
+])
+def test_compute_shared_in_process(calc_type, b_values, expected):
+    with SharedArray.from_values([0.0, 1.0, 2.0, 3.0, 4.0]) as a, \
+         SharedArray.from_values(b_values) as b, \
+         SharedArray(5) as out:
+        compute_shared(calc_type, a, b, out, processes=0, chunk_size=2)
+
+        assert out.tolist() == expected
+
+def test_compute_shared_scalar_operand():
+    with SharedArray.from_values([2.0, 4.0, 6.0]) as a, SharedArray(3) as out:
+        compute_shared('divide', a, 2, out, processes=0)
+
+        assert out.tolist() == [1.0, 2.0, 3.0]
+
+def test_compute_shared_worker_processes():
+    values = [float(i) for i in range(1000)]
+    with SharedArray.from_values(values) as a, \
+         SharedArray.from_values(values) as b, \
+         SharedArray(len(values)) as out:
+        compute_shared('subtract', a, b, out, processes=2, chunk_size=128)
+
+        assert out.tolist() == [0.0] * len(values)
+
+def test_compute_shared_division_by_zero():
+    with SharedArray.from_values([1.0, 2.0]) as a, \
+         SharedArray.from_values([1.0, 0.0]) as b, \
+         SharedArray(2) as out:
+        with pytest.raises(ZeroDivisionError) as exc_info:
+            _compute_slice(('divide', a.name, b.name, out.name, 0, 2))
+
+    assert "Cannot divide by zero." in str(exc_info.value)
+
+def test_compute_shared_length_mismatch():
+    with SharedArray(3) as a, SharedArray(2) as out:
+        with pytest.raises(ValueError) as exc_info:
+            compute_shared('add', a, 1.0, out)
+
+    assert "Shared operand and result buffers must have the same length." in str(exc_info.value)
+
+def test_compute_shared_invalid_chunk_size():
+    with SharedArray(3) as a, SharedArray(3) as out:
+        with pytest.raises(ValueError) as exc_info:
+            compute_shared('add', a, 1.0, out, chunk_size=0)
+
+    assert "Chunk size must be at least 1." in str(exc_info.value)
+
+def test_compute_shared_unsupported_calculation():
+    with SharedArray(3) as a, SharedArray(3) as out:
+        with pytest.raises(ValueError) as exc_info:
+            compute_shared('modulus', a, 1.0, out)
+
+    assert "Unsupported calculation type: 'modulus'" in str(exc_info.value)
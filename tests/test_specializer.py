@@ -0,0 +1,113 @@
+import pytest
+from app.calculation import Calculation, CalculationFactory
+from app.specializer import Specializer
+
+def test_specializer_specializes_hot_types():
+    specializer = Specializer(threshold=3)
+    results = [specializer.evaluate('add', float(i), 1.0) for i in range(5)]
+
+    assert results == [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert specializer.specialized_types() == ["add(float, float)"]
+    counters = specializer.counters()
+    assert counters["specializations"] == 1
+    assert counters["fallback_calls"] == 3
+    assert counters["specialized_calls"] == 2
+
+@pytest.mark.parametrize("calc_type, a, b, expected", [
+    ('subtract', 7.0, 3.0, 4.0),
+    ('multiply', 6, 5.0, 30.0),
+    ('divide', 15.0, 3, 5.0),
+])
+def test_specializer_matches_factory(calc_type, a, b, expected):
+    specializer = Specializer(threshold=1)
+
+    assert specializer.evaluate(calc_type, a, b) == expected
+    assert specializer.evaluate(calc_type, a, b) == expected
+    assert specializer.counters()["specialized_calls"] == 1
+
+def test_specializer_divide_by_zero():
+    specializer = Specializer(threshold=1)
+    specializer.evaluate('divide', 1.0, 2.0)
+
+    with pytest.raises(ZeroDivisionError) as exc_info:
+        specializer.evaluate('divide', 1.0, 0.0)
+
+    assert str(exc_info.value) == "Cannot divide by zero."
+    assert specializer.counters()["specialized_calls"] == 1
+
+def test_specializer_skips_vectors_and_custom_types():
+    @CalculationFactory.register_calculation('power')
+    class PowerCalculation(Calculation):
+        def execute(self) -> float:
+            return self.a ** self.b
+
+    specializer = Specializer(threshold=1)
+    specializer.evaluate('power', 2.0, 3.0)
+    specializer.evaluate('add', [1.0, 2.0], 1.0)
+
+    assert specializer.evaluate('power', 2.0, 3.0) == 8.0
+    assert specializer.evaluate('add', [1.0, 2.0], 1.0) == [2.0, 3.0]
+    assert specializer.specialized_types() == []
+
+def test_specializer_deoptimizes_when_registry_changes():
+    specializer = Specializer(threshold=1)
+    specializer.evaluate('multiply', 2.0, 3.0)
+
+    CalculationFactory._calculations.pop('multiply')
+
+    @CalculationFactory.register_calculation('multiply')
+    class PowerCalculation(Calculation):
+        def execute(self) -> float:
+            return self.a ** self.b
+
+    assert specializer.evaluate('multiply', 2.0, 3.0) == 8.0
+    assert specializer.counters()["deoptimizations"] == 1
+
+def test_specializer_unsupported_calculation():
+    specializer = Specializer(threshold=1)
+
+    with pytest.raises(ValueError) as exc_info:
+        specializer.evaluate('modulus', 4.0, 2.0)
+
+    assert "Unsupported calculation type: 'modulus'" in str(exc_info.value)
+
+def test_specializer_invalid_threshold():
+    with pytest.raises(ValueError) as exc_info:
+        Specializer(threshold=0)
+
+    assert "Specialization threshold must be at least 1." in str(exc_info.value)
+
+def test_evaluate_column_reciprocal_divide():
+    specializer = Specializer()
+    values = [1.0, 3.0, 0.1, -7.5]
+
+    assert specializer.evaluate_column('divide', values, 4.0) == [value / 4.0 for value in values]
+    assert specializer.counters()["reciprocal_columns"] == 1
+
+def test_evaluate_column_divide_exact():
+    specializer = Specializer()
+    values = [1.0, 3.0, 0.1]
+
+    assert specializer.evaluate_column('divide', values, 3.0) == [value / 3.0 for value in values]
+    assert specializer.evaluate_column('divide', values, 2.0 ** -1074) == [value / 2.0 ** -1074 for value in values]
+    assert specializer.evaluate_column('divide', [2 ** 53 + 3], 4) == [(2 ** 53 + 3) / 4]
+    assert specializer.counters()["reciprocal_columns"] == 0
+    assert specializer.counters()["column_calls"] == 3
+
+def test_evaluate_column_divide_by_zero():
+    specializer = Specializer()
+
+    assert specializer.evaluate_column('divide', [], 0) == []
+    with pytest.raises(ZeroDivisionError) as exc_info:
+        specializer.evaluate_column('divide', [1.0], 0)
+
+    assert str(exc_info.value) == "Cannot divide by zero."
+
+def test_evaluate_column_kernels_and_fallback():
+    specializer = Specializer()
+
+    assert specializer.evaluate_column('add', [1, 2.5], 1.0) == [2.0, 3.5]
+    assert specializer.evaluate_column('add', [[1.0, 2.0]], 1.0) == [[2.0, 3.0]]
+    assert specializer.evaluate_column('multiply', [1.0, 2.0], [2.0, 3.0]) == [[2.0, 3.0], [4.0, 6.0]]
+    assert specializer.counters()["column_calls"] == 1
+    assert specializer.counters()["fallback_calls"] == 3
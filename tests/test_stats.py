@@ -0,0 +1,157 @@
+import json
+import math
+import random
+import statistics
+import pytest
+from app.stats import KLLSketch, RunningStats, StreamingStatistics
+
+def test_running_stats_matches_statistics_module():
+    generator = random.Random(1)
+    values = [generator.uniform(-100, 100) for _ in range(50)]
+    stats = RunningStats()
+    for value in values:
+        stats.update(value)
+
+    assert stats.count == len(values)
+    assert stats.mean == pytest.approx(statistics.fmean(values))
+    assert stats.variance == pytest.approx(statistics.variance(values))
+    assert stats.pvariance == pytest.approx(statistics.pvariance(values))
+    assert stats.stdev == pytest.approx(statistics.stdev(values))
+    assert stats.min == min(values)
+    assert stats.max == max(values)
+
+def test_running_stats_empty():
+    stats = RunningStats()
+
+    assert math.isnan(stats.variance)
+    assert math.isnan(stats.pvariance)
+
+def test_running_stats_merge():
+    left_values = [1.0, 2.0, 3.0, 4.0]
+    right_values = [10.0, 20.0, -5.0]
+    left, right = RunningStats(), RunningStats()
+    for value in left_values:
+        left.update(value)
+    for value in right_values:
+        right.update(value)
+    left.merge(right)
+    left.merge(RunningStats())
+
+    values = left_values + right_values
+    assert left.count == len(values)
+    assert left.mean == pytest.approx(statistics.fmean(values))
+    assert left.variance == pytest.approx(statistics.variance(values))
+    assert (left.min, left.max) == (-5.0, 20.0)
+
+def test_running_stats_dict_round_trip():
+    stats = RunningStats()
+    stats.update(3.0)
+    stats.update(5.0)
+    restored = RunningStats.from_dict(json.loads(json.dumps(stats.to_dict())))
+
+    assert restored.to_dict() == stats.to_dict()
+
+def test_kll_sketch_exact_for_small_streams():
+    sketch = KLLSketch(k=200, seed=1)
+    for value in range(100, 0, -1):
+        sketch.update(float(value))
+
+    assert sketch.quantile(0) == 1.0
+    assert sketch.quantile(0.5) == 50.0
+    assert sketch.quantile(1) == 100.0
+
+def test_kll_sketch_large_stream_bounded_memory():
+    sketch = KLLSketch(k=200, seed=7)
+    values = list(range(100000))
+    random.Random(3).shuffle(values)
+    for value in values:
+        sketch.update(value)
+
+    assert sketch.count == 100000
+    assert sum(len(items) for items in sketch._compactors) < 1000
+    for q in (0.1, 0.5, 0.9, 0.99):
+        assert abs(sketch.quantile(q) - q * 100000) < 2000
+
+def test_kll_sketch_merge():
+    left, right = KLLSketch(seed=1), KLLSketch(seed=2)
+    for value in range(50000):
+        left.update(value)
+    for value in range(50000, 60000):
+        right.update(value)
+    right.merge(left)
+
+    assert right.count == 60000
+    assert abs(right.quantile(0.5) - 30000) < 1500
+
+def test_kll_sketch_merge_many_levels():
+    merged = KLLSketch(k=8, seed=1)
+    for seed in range(20):
+        sketch = KLLSketch(k=8, seed=seed)
+        for value in range(1000):
+            sketch.update(value)
+        merged.merge(sketch)
+
+    assert merged.count == 20000
+    assert sum(len(items) for items in merged._compactors) < merged._max_size
+    assert 200 <= merged.quantile(0.5) <= 800
+
+def test_kll_sketch_empty_and_invalid():
+    sketch = KLLSketch()
+
+    assert math.isnan(sketch.quantile(0.5))
+    with pytest.raises(ValueError) as exc_info:
+        sketch.quantile(1.5)
+    assert "Quantile must be between 0 and 1." in str(exc_info.value)
+    with pytest.raises(ValueError) as exc_info:
+        KLLSketch(k=4)
+    assert "Sketch size k must be at least 8." in str(exc_info.value)
+
+def test_kll_sketch_dict_round_trip():
+    sketch = KLLSketch(k=16, seed=5)
+    for value in range(1000):
+        sketch.update(value)
+    restored = KLLSketch.from_dict(json.loads(json.dumps(sketch.to_dict())), seed=5)
+
+    assert restored.to_dict() == sketch.to_dict()
+    assert restored.quantile(0.5) == sketch.quantile(0.5)
+    restored.update(1000)
+    assert restored.count == 1001
+
+def test_streaming_statistics_vectors_and_merge():
+    session = StreamingStatistics(seed=1)
+    session.update(1.0)
+    session.update([2.0, [3.0, 4.0]])
+    worker = StreamingStatistics.from_dict(json.loads(json.dumps(session.to_dict())), seed=2)
+    worker.update(10.0)
+    worker.update(math.inf)
+    session.merge(worker)
+
+    assert len(session) == 10
+    assert session.nonfinite == 1
+    assert session.stats.max == 10.0
+    assert session.quantile(0.5) == 3.0
+
+def test_streaming_statistics_summary():
+    stats = StreamingStatistics()
+    stats.update([1.0, 2.0, 3.0])
+    summary = stats.summary()
+
+    assert "count    : 3" in summary
+    assert "mean     : 2.0" in summary
+    assert "variance : 1.0" in summary
+    assert "p50      : 2.0" in summary
+
+def test_streaming_statistics_skips_non_finite_results():
+    stats = StreamingStatistics()
+    stats.update([1.0, math.inf, 3.0])
+    stats.update(math.nan)
+    stats.update(-math.inf)
+
+    assert len(stats) == 5
+    assert stats.nonfinite == 3
+    assert stats.stats.count == 2
+    assert stats.stats.mean == 2.0
+    assert stats.stats.variance == 2.0
+    assert stats.stats.max == 3.0
+    assert stats.quantile(1.0) == 3.0
+    assert "inf/nan  : 3" in stats.summary()